@@ -0,0 +1,236 @@
+"""Exact-match response cache for LLM calls."""
+
+import asyncio
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, TypeVar
+
+from langchain_core.runnables import Runnable
+from pydantic import BaseModel
+
+from src.config import get_settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class CacheBackend(ABC):
+    """Abstract storage backend for cached LLM responses."""
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value under a key with an optional TTL in seconds."""
+        pass
+
+
+class MemoryBackend(CacheBackend):
+    """In-process backend; the oldest entries are evicted past max_entries."""
+
+    def __init__(self, max_entries: int = 1024):
+        """Initialize the in-memory backend."""
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[str, float | None]] = {}
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for a key."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value under a key."""
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._entries.pop(key, None)
+        self._entries[key] = (value, expires_at)
+
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+
+class FileBackend(CacheBackend):
+    """Backend storing one JSON file per key, useful across dev restarts."""
+
+    def __init__(self, directory: str | Path):
+        """Initialize the file backend."""
+        self.directory = Path(directory)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> str | None:
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at < time.time():
+            self._path(key).unlink(missing_ok=True)
+            return None
+        return entry["value"]
+
+    def _write(self, key: str, value: str, ttl: int | None) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {"value": value, "expires_at": time.time() + ttl if ttl else None}
+        self._path(key).write_text(json.dumps(entry), encoding="utf-8")
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for a key."""
+        return await asyncio.to_thread(self._read, key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value under a key."""
+        await asyncio.to_thread(self._write, key, value, ttl)
+
+
+class RedisBackend(CacheBackend):
+    """Backend storing values in Redis, shared across processes."""
+
+    KEY_PREFIX = "llm_cache:"
+
+    def __init__(self, url: str):
+        """Initialize the Redis backend.
+
+        Raises:
+            ValueError: If no Redis URL is configured.
+        """
+        if not url:
+            raise ValueError("Redis cache backend requires REDIS_URL to be set.")
+
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url, decode_responses=True)
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached value for a key."""
+        return await self._redis.get(self.KEY_PREFIX + key)
+
+    async def set(self, key: str, value: str, ttl: int | None = None) -> None:
+        """Store a value under a key."""
+        await self._redis.set(self.KEY_PREFIX + key, value, ex=ttl)
+
+
+class LLMCache:
+    """Exact-match cache for LLM responses.
+
+    Keys are a SHA-256 of the model name plus the prompt inputs, so a cached
+    response is only reused for an identical request.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        model: str,
+        ttl: int | None = None,
+        enabled: bool = True,
+    ):
+        """Initialize the cache."""
+        self.backend = backend
+        self.model = model
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, **inputs: Any) -> str:
+        """Build a deterministic cache key from the prompt inputs."""
+        payload = json.dumps({"model": self.model, **inputs}, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _get_or_call(
+        self, key_inputs: dict[str, Any], call: Callable[[], Awaitable[str]]
+    ) -> str:
+        """Return the cached value for the key inputs, calling on a miss."""
+        if not self.enabled:
+            return await call()
+
+        key = self.make_key(**key_inputs)
+        cached = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        value = await call()
+        await self.backend.set(key, value, self.ttl)
+        return value
+
+    async def ainvoke(
+        self, chain: Runnable, inputs: dict[str, Any], **key_inputs: Any
+    ) -> str:
+        """Invoke a chain, returning the cached response content when available.
+
+        Args:
+            chain: The prompt | LLM chain to invoke on a miss.
+            inputs: Inputs passed to the chain.
+            **key_inputs: Values identifying the request in the cache key.
+
+        Returns:
+            The text content of the LLM response.
+        """
+
+        async def call() -> str:
+            response = await chain.ainvoke(inputs)
+            return response.content
+
+        return await self._get_or_call(key_inputs, call)
+
+    async def ainvoke_structured(
+        self,
+        chain: Runnable,
+        schema: type[ModelT],
+        inputs: dict[str, Any],
+        **key_inputs: Any,
+    ) -> ModelT:
+        """Invoke a structured-output chain, using the cache when available.
+
+        Args:
+            chain: The prompt | structured LLM chain to invoke on a miss.
+            schema: The Pydantic model the chain returns.
+            inputs: Inputs passed to the chain.
+            **key_inputs: Values identifying the request in the cache key.
+
+        Returns:
+            The parsed structured response.
+        """
+
+        async def call() -> str:
+            result = await chain.ainvoke(inputs)
+            return result.model_dump_json()
+
+        return schema.model_validate_json(await self._get_or_call(key_inputs, call))
+
+
+@lru_cache
+def get_llm_cache() -> LLMCache:
+    """Get the configured LLM cache instance."""
+    settings = get_settings()
+
+    if settings.llm_cache_backend == "redis":
+        backend: CacheBackend = RedisBackend(settings.redis_url)
+    elif settings.llm_cache_backend == "file":
+        backend = FileBackend(settings.llm_cache_dir)
+    else:
+        backend = MemoryBackend()
+
+    return LLMCache(
+        backend,
+        model=settings.llm_model,
+        ttl=settings.llm_cache_ttl,
+        enabled=settings.llm_cache_enabled,
+    )
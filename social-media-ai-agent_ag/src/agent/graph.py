@@ -1,7 +1,16 @@
 """LangGraph workflow definition for the social media agent."""
 
+import json
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from langgraph.cache.base import BaseCache
+from langgraph.cache.memory import InMemoryCache
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import END, StateGraph
+from langgraph.types import CachePolicy
 
 from src.agent.nodes import (
     generate_post,
@@ -10,7 +19,25 @@ from src.agent.nodes import (
     request_approval,
     should_regenerate,
 )
+from src.agent.serde import PydanticJsonSerializer
 from src.agent.state import AgentState, PostStatus
+from src.config import get_settings
+
+
+def _generate_cache_key(state: AgentState) -> str:
+    """Build the node cache key from the inputs that determine a generated post.
+
+    generation_attempts is bumped on every reject, so regenerations always miss.
+    """
+    return json.dumps(
+        [
+            state["topic"],
+            state["platform"].value,
+            state["tone"],
+            state["additional_context"],
+            state["generation_attempts"],
+        ]
+    )
 
 
 def create_graph() -> StateGraph:
@@ -24,11 +51,19 @@ def create_graph() -> StateGraph:
 
     The graph supports regeneration loops when posts are rejected.
     """
+    settings = get_settings()
+
     # Create the graph with our state schema
     graph = StateGraph(AgentState)
 
-    # Add nodes
-    graph.add_node("generate", generate_post)
+    # Add nodes. Generation is a pure function of the request and attempt
+    # number, so its output can be served from the node cache.
+    generate_cache_policy = None
+    if settings.llm_cache_enabled:
+        generate_cache_policy = CachePolicy(
+            key_func=_generate_cache_key, ttl=settings.llm_cache_ttl
+        )
+    graph.add_node("generate", generate_post, cache_policy=generate_cache_policy)
     graph.add_node("request_approval", request_approval)
     graph.add_node("process_feedback", process_feedback)
     graph.add_node("publish", publish_post)
@@ -59,12 +94,17 @@ def create_graph() -> StateGraph:
     return graph
 
 
-def compile_graph(checkpointer: MemorySaver | None = None):
-    """Compile the graph with optional checkpointing.
+def compile_graph(
+    checkpointer: BaseCheckpointSaver | None = None,
+    cache: BaseCache | None = None,
+):
+    """Compile the graph with optional checkpointing and node caching.
 
     Args:
         checkpointer: Optional checkpointer for state persistence.
                      Required for human-in-the-loop to work across restarts.
+        cache: Optional cache backend for nodes with a cache policy.
+               Defaults to an in-memory cache when LLM caching is enabled.
 
     Returns:
         Compiled graph ready for execution.
@@ -73,15 +113,50 @@ def compile_graph(checkpointer: MemorySaver | None = None):
 
     if checkpointer is None:
         # Use in-memory checkpointer by default
-        checkpointer = MemorySaver()
+        checkpointer = MemorySaver(serde=PydanticJsonSerializer())
+
+    if cache is None and get_settings().llm_cache_enabled:
+        cache = InMemoryCache()
+
+    return graph.compile(checkpointer=checkpointer, cache=cache)
+
+
+@asynccontextmanager
+async def open_checkpointer() -> AsyncIterator[BaseCheckpointSaver]:
+    """Open the configured checkpointer for the lifetime of a server.
+
+    Uses Redis when REDIS_URL is set, so workflow state survives restarts
+    and is shared across workers, and an in-memory saver otherwise.
+    Redis checkpoints expire together with their pending post.
+    """
+    settings = get_settings()
+
+    if not settings.redis_url:
+        yield MemorySaver(serde=PydanticJsonSerializer())
+        return
+
+    from langgraph.checkpoint.redis.aio import AsyncRedisSaver
+
+    from src.agent.redis_serde import RedisPydanticSerializer
+
+    ttl = None
+    if settings.pending_ttl:
+        ttl = {"default_ttl": settings.pending_ttl / 60, "refresh_on_read": True}
 
-    return graph.compile(checkpointer=checkpointer)
+    # Entering the saver creates its search indices (asetup)
+    async with AsyncRedisSaver.from_conn_string(settings.redis_url, ttl=ttl) as saver:
+        # The saver always builds its own serializer, which loses model types
+        saver.serde = RedisPydanticSerializer()
+        yield saver
 
 
 # Pre-compiled graph instance for convenience
+@lru_cache(maxsize=1)
 def get_compiled_graph():
-    """Get a compiled graph with memory checkpointing.
+    """Get the shared compiled graph with memory checkpointing.
 
-    This is the main entry point for running the agent.
+    This is the main entry point for running the agent. The graph is built
+    once, so every caller shares the same checkpointer and a thread started
+    by one call can be resumed by the next.
     """
     return compile_graph()
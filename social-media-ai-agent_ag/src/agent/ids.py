@@ -0,0 +1,40 @@
+"""Thread ID generation for agent workflows."""
+
+import os
+import threading
+import uuid
+
+# Random bytes drawn from the OS per refill; each ID uses 16 of them
+ENTROPY_POOL_SIZE = 4096
+
+_entropy = b""
+_offset = 0
+_entropy_lock = threading.Lock()
+
+
+def _reset_entropy() -> None:
+    # A forked worker must not hand out the same IDs as its parent
+    global _entropy, _offset
+    _entropy, _offset = b"", 0
+
+
+os.register_at_fork(after_in_child=_reset_entropy)
+
+
+def new_thread_id() -> str:
+    """Generate a random (version 4) UUID string for a new workflow thread.
+
+    Randomness is read from os.urandom in 4 KiB blocks and sliced into
+    16-byte chunks, so 256 IDs cost one system call instead of one each.
+    """
+    global _entropy, _offset
+
+    with _entropy_lock:
+        if _offset + 16 > len(_entropy):
+            _entropy = os.urandom(ENTROPY_POOL_SIZE)
+            _offset = 0
+        chunk = _entropy[_offset : _offset + 16]
+        _offset += 16
+
+    # Setting the version also sets the RFC 4122 variant bits
+    return str(uuid.UUID(bytes=chunk, version=4))
@@ -1,33 +1,54 @@
 """LLM initialization for the social media agent."""
 
-from functools import lru_cache
-
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import SystemMessage
 
 from src.config import get_settings
 
+# Import only the configured provider's client, and do it at application
+# start-up rather than on the first generation request.
+if get_settings().llm_provider == "anthropic":
+    from langchain_anthropic import ChatAnthropic as ChatModel
+else:
+    from langchain_openai import ChatOpenAI as ChatModel
+
+_llm: BaseChatModel | None = None
+
 
-@lru_cache
 def get_llm() -> BaseChatModel:
     """Get the configured LLM instance.
 
-    Returns either OpenAI or Anthropic based on settings.
+    Returns either OpenAI or Anthropic based on settings. The instance is
+    created on first use and shared afterwards.
     """
-    settings = get_settings()
-
-    if settings.llm_provider == "anthropic":
-        from langchain_anthropic import ChatAnthropic
-
-        return ChatAnthropic(
+    global _llm
+
+    if _llm is None:
+        settings = get_settings()
+        api_key = (
+            settings.anthropic_api_key
+            if settings.llm_provider == "anthropic"
+            else settings.openai_api_key
+        )
+        _llm = ChatModel(
             model=settings.llm_model,
-            api_key=settings.anthropic_api_key,
+            api_key=api_key,
             temperature=0.7,
         )
-    else:
-        from langchain_openai import ChatOpenAI
 
-        return ChatOpenAI(
-            model=settings.llm_model,
-            api_key=settings.openai_api_key,
-            temperature=0.7,
+    return _llm
+
+
+def cacheable_system_message(text: str) -> SystemMessage:
+    """Build a system message the provider can serve from its prompt cache.
+
+    Anthropic only caches prefixes marked with cache_control; OpenAI caches
+    byte-identical prefixes automatically, so the text is passed through as-is.
+    """
+    if get_settings().llm_provider == "anthropic":
+        return SystemMessage(
+            content=[
+                {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+            ]
         )
+    return SystemMessage(content=text)
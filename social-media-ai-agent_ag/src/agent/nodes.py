@@ -1,11 +1,24 @@
 """LangGraph node implementations for the social media agent."""
 
+import re
+from contextlib import suppress
+from itertools import islice
+
 from langchain_core.messages import AIMessage, HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable
 from langgraph.types import interrupt
 
-from src.agent.llm import get_llm
-from src.agent.state import AgentState, HumanFeedback, Platform, PostContent, PostStatus
+from src.agent.cache import get_llm_cache
+from src.agent.llm import cacheable_system_message, get_llm
+from src.agent.state import (
+    AgentState,
+    HumanFeedback,
+    Platform,
+    PostContent,
+    PostDraft,
+    PostStatus,
+)
 
 
 # Platform-specific prompts
@@ -28,98 +41,229 @@ Create professional posts that:
 }
 
 
-POST_GENERATION_TEMPLATE = ChatPromptTemplate.from_messages(
-    [
-        ("system", "{platform_prompt}"),
-        (
-            "human",
-            """Create a {platform} post about the following topic:
+# Hashtag tokens in an LLM response, with or without a leading "#". Bare
+# numbers are skipped so enumerated output ("1. foo") parses cleanly.
+HASHTAG_RE = re.compile(r"#?\b(?!\d+\b)(\w+)")
 
-Topic: {topic}
-Desired Tone: {tone}
-{additional_context}
+# A run of "#tag" tokens at the very end of a generated post
+TRAILING_HASHTAGS_RE = re.compile(r"(?:\s*#\w+)+\s*$")
 
-Respond with ONLY the post text. Do not include hashtags in the main text - I will ask for those separately.""",
-        ),
-    ]
-)
+# Extra LLM calls allowed when a draft is over the platform's length limit
+MAX_LENGTH_RETRIES = 2
 
-HASHTAG_TEMPLATE = ChatPromptTemplate.from_messages(
-    [
-        (
-            "human",
-            """Given this {platform} post:
+# Number of hashtags requested per platform
+NUM_HASHTAGS = {
+    Platform.TWITTER: 3,
+    Platform.LINKEDIN: 5,
+}
 
-"{post_text}"
 
-Suggest {num_hashtags} relevant hashtags. Return ONLY the hashtags, one per line, without the # symbol.""",
-        ),
-    ]
-)
+# Static instructions come first and per-request values last, keeping the
+# cacheable prefix as long as possible.
+POST_GENERATION_PROMPT = """Create a {platform} post about the topic below, along with {num_hashtags} relevant hashtags for it. Keep the hashtags out of the post text and give them without the # symbol.
 
+Topic: {topic}
+Desired Tone: {tone}
+{additional_context}"""
+
+HASHTAG_PROMPT = """Suggest {num_hashtags} relevant hashtags for a {platform} post about the topic below. Return ONLY the hashtags, one per line, without the # symbol.
+
+Topic: {topic}"""
+
+
+def _bake(template: str, **values: object) -> str:
+    """Substitute fixed per-platform values into a prompt template up front."""
+    for name, value in values.items():
+        template = template.replace(f"{{{name}}}", str(value))
+    return template
+
+
+# One template per platform with the system message and platform details
+# baked in, so each call only substitutes the request fields and the prompt
+# prefix is byte-identical across generation and regeneration turns.
+POST_GENERATION_TEMPLATES = {
+    platform: ChatPromptTemplate.from_messages(
+        [
+            cacheable_system_message(prompt),
+            (
+                "human",
+                _bake(
+                    POST_GENERATION_PROMPT,
+                    platform=platform.value,
+                    num_hashtags=NUM_HASHTAGS[platform],
+                ),
+            ),
+        ]
+    )
+    for platform, prompt in PLATFORM_PROMPTS.items()
+}
 
-async def generate_post(state: AgentState) -> dict:
-    """Generate a social media post using the LLM.
+HASHTAG_TEMPLATES = {
+    platform: ChatPromptTemplate.from_messages(
+        [
+            (
+                "human",
+                _bake(
+                    HASHTAG_PROMPT,
+                    platform=platform.value,
+                    num_hashtags=NUM_HASHTAGS[platform],
+                ),
+            ),
+        ]
+    )
+    for platform in PLATFORM_PROMPTS
+}
 
-    This node uses the LLM to create post content based on the user's request.
-    """
-    llm = get_llm()
 
-    # Get platform-specific prompt
-    platform_prompt = PLATFORM_PROMPTS.get(
-        state.platform, PLATFORM_PROMPTS[Platform.TWITTER]
-    )
+# Chains are bound to the LLM on first use and shared afterwards
+_post_chains: dict[Platform, Runnable] | None = None
+_hashtag_chains: dict[Platform, Runnable] | None = None
 
-    # Build additional context string
-    additional_context = ""
-    if state.additional_context:
-        additional_context = f"Additional requirements: {state.additional_context}"
 
-    # Generate post text
-    chain = POST_GENERATION_TEMPLATE | llm
-    response = await chain.ainvoke(
-        {
-            "platform_prompt": platform_prompt,
-            "platform": state.platform.value,
-            "topic": state.topic,
-            "tone": state.tone,
-            "additional_context": additional_context,
+def _get_chains() -> tuple[dict[Platform, Runnable], dict[Platform, Runnable]]:
+    """Get the per-platform post and hashtag chains, building them once."""
+    global _post_chains, _hashtag_chains
+
+    if _post_chains is None or _hashtag_chains is None:
+        llm = get_llm()
+        structured_llm = llm.with_structured_output(PostDraft)
+        _post_chains = {
+            platform: template | structured_llm
+            for platform, template in POST_GENERATION_TEMPLATES.items()
         }
-    )
+        _hashtag_chains = {
+            platform: template | llm for platform, template in HASHTAG_TEMPLATES.items()
+        }
+
+    return _post_chains, _hashtag_chains
 
-    post_text = response.content.strip()
 
-    # Generate hashtags
-    num_hashtags = 3 if state.platform == Platform.TWITTER else 5
-    hashtag_chain = HASHTAG_TEMPLATE | llm
-    hashtag_response = await hashtag_chain.ainvoke(
+def warm_up() -> None:
+    """Create the LLM client, chains, cache and connectors ahead of the first request.
+
+    Building them loads provider SDKs, TLS certificates and settings, which
+    is blocking work; callers run this in a worker thread at start-up.
+    """
+    from src.connectors import get_connector
+
+    # Errors such as a missing API key are left to surface on first use
+    with suppress(Exception):
+        _get_chains()
+    get_llm_cache()
+    for platform in Platform:
+        get_connector(platform)
+
+
+async def _draft_post(
+    state: AgentState,
+    platform: Platform,
+    additional_context: str,
+    length_retry: int,
+) -> PostContent:
+    """Run the LLM once and turn its draft into PostContent."""
+    llm = get_llm()
+    post_chains, hashtag_chains = _get_chains()
+
+    # Text and hashtags come back from a single structured-output call.
+    # Responses are cached per attempt so a rejected post is never served again.
+    cache = get_llm_cache()
+    cache_key_inputs = {
+        "platform": state["platform"].value,
+        "topic": state["topic"],
+        "tone": state["tone"],
+        "additional_context": state["additional_context"],
+        "temperature": getattr(llm, "temperature", None),
+        "attempt": state["generation_attempts"],
+        "length_retry": length_retry,
+    }
+    num_hashtags = NUM_HASHTAGS[platform]
+    draft = await cache.ainvoke_structured(
+        post_chains[platform],
+        PostDraft,
         {
-            "platform": state.platform.value,
-            "post_text": post_text,
-            "num_hashtags": num_hashtags,
-        }
+            "topic": state["topic"],
+            "tone": state["tone"],
+            "additional_context": additional_context,
+        },
+        prompt="post",
+        **cache_key_inputs,
     )
 
+    post_text = draft.text.strip()
     hashtags = [
-        tag.strip().lstrip("#")
-        for tag in hashtag_response.content.strip().split("\n")
-        if tag.strip()
-    ]
+        cleaned for tag in draft.hashtags if (cleaned := "".join(HASHTAG_RE.findall(tag)))
+    ][:num_hashtags]
+
+    # Keep hashtags out of the body even if the model appended some there,
+    # and use them when the structured hashtag list came back empty.
+    trailing = TRAILING_HASHTAGS_RE.search(post_text)
+    if trailing and trailing.start() > 0:
+        hashtags = hashtags or HASHTAG_RE.findall(trailing.group())[:num_hashtags]
+        post_text = post_text[: trailing.start()].rstrip()
+
+    # Only make a separate hashtag request if the draft had none at all
+    if not hashtags:
+        hashtag_text = await cache.ainvoke(
+            hashtag_chains[platform],
+            {"topic": state["topic"]},
+            prompt="hashtags",
+            **cache_key_inputs,
+        )
+        hashtags = [
+            match.group(1)
+            for match in islice(HASHTAG_RE.finditer(hashtag_text), num_hashtags)
+        ]
 
-    # Create post content
-    post_content = PostContent(
+    return PostContent(
         text=post_text,
-        platform=state.platform,
-        hashtags=hashtags[:num_hashtags],
+        platform=state["platform"],
+        hashtags=hashtags,
     )
 
+
+async def generate_post(state: AgentState) -> dict:
+    """Generate a social media post using the LLM.
+
+    This node uses the LLM to create post content based on the user's request.
+    Drafts over the platform's character limit are re-prompted in place, up to
+    MAX_LENGTH_RETRIES times, instead of going back through human review.
+    """
+    from src.connectors import get_connector
+
+    # Get platform-specific chains
+    platform = state["platform"] if state["platform"] in PLATFORM_PROMPTS else Platform.TWITTER
+    max_length = get_connector(platform).max_length
+
+    # Build additional context string
+    base_context = ""
+    if state["additional_context"]:
+        base_context = f"Additional requirements: {state['additional_context']}"
+
+    additional_context = base_context
+    for length_retry in range(MAX_LENGTH_RETRIES + 1):
+        post_content = await _draft_post(state, platform, additional_context, length_retry)
+        if post_content.char_count <= max_length:
+            break
+
+        over = post_content.char_count - max_length
+        additional_context = (
+            f"{base_context}\nThe previous attempt was {over} characters over the "
+            f"{max_length} character limit (including hashtags). Make it shorter."
+        ).strip()
+
+    # The message only summarizes the draft; the text itself lives in
+    # post_content and the drafts history, so checkpoints stay small.
     return {
         "post_content": post_content,
+        "drafts": [post_content],
         "status": PostStatus.PENDING_APPROVAL,
-        "generation_attempts": state.generation_attempts + 1,
+        "generation_attempts": state["generation_attempts"] + 1,
         "messages": [
             AIMessage(
-                content=f"Generated {state.platform.value} post:\n\n{post_content.formatted_text}"
+                content=(
+                    f"Generated {state['platform'].value} post "
+                    f"({post_content.char_count} chars)"
+                )
             )
         ],
     }
@@ -131,16 +275,17 @@ async def request_approval(state: AgentState) -> dict:
     This node uses LangGraph's interrupt() to pause the workflow
     and wait for human feedback.
     """
-    if state.post_content is None:
+    post_content = state.get("post_content")
+    if post_content is None:
         return {"error_message": "No post content to approve"}
 
     # Create the approval request payload
     approval_request = {
         "type": "approval_request",
-        "post_text": state.post_content.formatted_text,
-        "platform": state.platform.value,
-        "char_count": state.post_content.char_count,
-        "generation_attempt": state.generation_attempts,
+        "post_text": post_content.formatted_text,
+        "platform": state["platform"].value,
+        "char_count": post_content.char_count,
+        "generation_attempt": state["generation_attempts"],
         "instructions": (
             "Please review this post and respond with one of:\n"
             "- 'approve' to publish as-is\n"
@@ -169,15 +314,17 @@ def _parse_human_response(response: str | dict) -> HumanFeedback:
     if isinstance(response, dict):
         return HumanFeedback(**response)
 
-    response_str = str(response).strip().lower()
+    # Only the command word is lowercased; the edited text keeps its casing
+    response_str = str(response).strip()
+    head, sep, rest = response_str.partition(":")
+    command = head.strip().lower()
 
-    if response_str == "approve":
+    if command == "approve":
         return HumanFeedback(action="approve")
-    elif response_str == "reject":
-        return HumanFeedback(action="reject")
-    elif response_str.startswith("edit:"):
-        edited_text = response_str[5:].strip()
-        return HumanFeedback(action="edit", edited_text=edited_text)
+    elif command == "reject":
+        return HumanFeedback(action="reject", feedback_message=rest.strip() or None)
+    elif command == "edit" and sep:
+        return HumanFeedback(action="edit", edited_text=rest.strip())
     else:
         # Default to approve if unclear
         return HumanFeedback(
@@ -187,19 +334,18 @@ def _parse_human_response(response: str | dict) -> HumanFeedback:
 
 async def process_feedback(state: AgentState) -> dict:
     """Process human feedback and update state accordingly."""
-    if state.human_feedback is None:
+    feedback = state.get("human_feedback")
+    if feedback is None:
         return {"status": PostStatus.PENDING_APPROVAL}
 
-    feedback = state.human_feedback
-
     if feedback.action == "approve":
         return {"status": PostStatus.APPROVED}
 
     elif feedback.action == "reject":
-        if state.generation_attempts >= state.max_attempts:
+        if state["generation_attempts"] >= state["max_attempts"]:
             return {
                 "status": PostStatus.FAILED,
-                "error_message": f"Max generation attempts ({state.max_attempts}) reached",
+                "error_message": f"Max generation attempts ({state['max_attempts']}) reached",
             }
         return {
             "status": PostStatus.DRAFT,
@@ -208,11 +354,12 @@ async def process_feedback(state: AgentState) -> dict:
 
     elif feedback.action == "edit":
         # Update post content with edited text
-        if state.post_content and feedback.edited_text:
+        post_content = state.get("post_content")
+        if post_content and feedback.edited_text:
             updated_content = PostContent(
                 text=feedback.edited_text,
-                platform=state.platform,
-                hashtags=state.post_content.hashtags,
+                platform=state["platform"],
+                hashtags=post_content.hashtags,
             )
             return {
                 "post_content": updated_content,
@@ -227,22 +374,24 @@ async def publish_post(state: AgentState) -> dict:
     """Publish the approved post to the target platform."""
     from src.connectors import get_connector
 
-    if state.post_content is None:
+    post_content = state.get("post_content")
+    if post_content is None:
         return {
             "status": PostStatus.FAILED,
             "error_message": "No post content to publish",
         }
 
     try:
-        connector = get_connector(state.platform)
-        result = await connector.publish(state.post_content.formatted_text)
+        connector = get_connector(state["platform"])
+        result = await connector.publish(post_content.formatted_text)
+        published_url = result.get("url")
 
         return {
             "status": PostStatus.PUBLISHED,
-            "published_url": result.get("url"),
+            "published_url": published_url,
             "messages": [
                 AIMessage(
-                    content=f"✅ Successfully published to {state.platform.value}!\nURL: {result.get('url', 'N/A')}"
+                    content=f"✅ Successfully published to {state['platform'].value}!\nURL: {published_url or 'N/A'}"
                 )
             ],
         }
@@ -261,9 +410,9 @@ def should_regenerate(state: AgentState) -> str:
 
     Returns the name of the next node to execute.
     """
-    if state.status == PostStatus.APPROVED:
+    if state["status"] == PostStatus.APPROVED:
         return "publish"
-    elif state.status == PostStatus.DRAFT:
+    elif state["status"] == PostStatus.DRAFT:
         return "generate"
     else:
         return "end"
@@ -0,0 +1,279 @@
+"""Shared store for posts awaiting human approval."""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager, suppress
+from functools import lru_cache
+from typing import TypedDict
+
+import orjson
+
+from src.agent.state import AgentState, PostStatus
+from src.config import get_settings
+
+
+class PendingEntry(TypedDict):
+    """Projected fields for a pending post.
+
+    The full workflow state lives in the LangGraph checkpointer; this only
+    holds what is needed to list and route pending posts.
+    """
+
+    topic: str
+    platform: str
+    post_text: str
+    char_count: int
+    attempts: int
+
+
+# A change to the store: the thread ID and its new entry, or None if removed
+PendingChange = tuple[str, PendingEntry | None]
+
+# Entry fields stored as integers; Redis hashes return every value as a string
+_INT_FIELDS = ("char_count", "attempts")
+
+
+def project_pending(state: AgentState) -> PendingEntry | None:
+    """Project the fields needed to list a post from its workflow state.
+
+    Returns:
+        The pending entry, or None unless the workflow awaits approval.
+    """
+    post_content = state.get("post_content")
+    if post_content is None or state.get("status") != PostStatus.PENDING_APPROVAL:
+        return None
+
+    return {
+        "topic": state["topic"],
+        "platform": state["platform"].value,
+        "post_text": post_content.formatted_text,
+        "char_count": post_content.char_count,
+        "attempts": state.get("generation_attempts", 1),
+    }
+
+
+class PendingStore(ABC):
+    """Abstract storage backend for pending posts, keyed by thread ID."""
+
+    @abstractmethod
+    async def get(self, thread_id: str) -> PendingEntry | None:
+        """Return the pending entry for a thread, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, thread_id: str, entry: PendingEntry) -> None:
+        """Store or replace the pending entry for a thread."""
+        pass
+
+    @abstractmethod
+    async def delete(self, thread_id: str) -> None:
+        """Remove the pending entry for a thread."""
+        pass
+
+    @abstractmethod
+    def items(self) -> AsyncIterator[tuple[str, PendingEntry]]:
+        """Iterate over (thread_id, entry) pairs for all pending posts."""
+        pass
+
+    @abstractmethod
+    def subscribe(self) -> AbstractAsyncContextManager[asyncio.Queue[PendingChange]]:
+        """Open a queue that receives every change made to the store.
+
+        Expired entries are not announced.
+        """
+        pass
+
+    async def record(self, thread_id: str, state: AgentState) -> None:
+        """Store a workflow's projected fields while it awaits approval, else drop it."""
+        entry = project_pending(state)
+        if entry is None:
+            await self.delete(thread_id)
+        else:
+            await self.set(thread_id, entry)
+
+    async def aclose(self) -> None:
+        """Release any resources held by the store."""
+        pass
+
+
+class MemoryPendingStore(PendingStore):
+    """In-process store; only visible to the current worker."""
+
+    def __init__(self, ttl: int | None = None):
+        """Initialize the in-memory store."""
+        self.ttl = ttl
+        self._entries: dict[str, tuple[PendingEntry, float | None]] = {}
+        self._subscribers: set[asyncio.Queue[PendingChange]] = set()
+
+    def _notify(self, thread_id: str, entry: PendingEntry | None) -> None:
+        for queue in self._subscribers:
+            queue.put_nowait((thread_id, entry))
+
+    def _live(self, thread_id: str) -> PendingEntry | None:
+        entry = self._entries.get(thread_id)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self._entries[thread_id]
+            return None
+        return value
+
+    async def get(self, thread_id: str) -> PendingEntry | None:
+        """Return the pending entry for a thread."""
+        return self._live(thread_id)
+
+    async def set(self, thread_id: str, entry: PendingEntry) -> None:
+        """Store or replace the pending entry for a thread."""
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        self._entries[thread_id] = (entry, expires_at)
+        self._notify(thread_id, entry)
+
+    async def delete(self, thread_id: str) -> None:
+        """Remove the pending entry for a thread."""
+        if self._entries.pop(thread_id, None) is not None:
+            self._notify(thread_id, None)
+
+    async def items(self) -> AsyncIterator[tuple[str, PendingEntry]]:
+        """Iterate over (thread_id, entry) pairs for all pending posts."""
+        for thread_id in list(self._entries):
+            entry = self._live(thread_id)
+            if entry is not None:
+                yield thread_id, entry
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[PendingChange]]:
+        """Open a queue that receives every change made to the store."""
+        queue: asyncio.Queue[PendingChange] = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            self._subscribers.discard(queue)
+
+
+class RedisPendingStore(PendingStore):
+    """Store keeping one Redis hash per pending post, shared across workers.
+
+    A Redis set indexes the pending thread IDs, so listing reads only the
+    pending hashes instead of scanning the whole keyspace.
+    """
+
+    KEY_PREFIX = "pending:"
+    INDEX_KEY = "pending_ids"
+    CHANGES_CHANNEL = "pending_changes"
+
+    def __init__(self, url: str, ttl: int | None = None):
+        """Initialize the Redis store.
+
+        Raises:
+            ValueError: If no Redis URL is configured.
+        """
+        if not url:
+            raise ValueError("Redis pending store requires REDIS_URL to be set.")
+
+        from redis.asyncio import Redis
+
+        self.ttl = ttl
+        self._redis = Redis.from_url(url, decode_responses=True)
+
+    @staticmethod
+    def _decode(fields: dict[str, str]) -> PendingEntry:
+        entry = dict(fields)
+        for name in _INT_FIELDS:
+            entry[name] = int(entry.get(name) or 0)
+        return entry  # type: ignore[return-value]
+
+    async def get(self, thread_id: str) -> PendingEntry | None:
+        """Return the pending entry for a thread."""
+        fields = await self._redis.hgetall(self.KEY_PREFIX + thread_id)
+        return self._decode(fields) if fields else None
+
+    async def set(self, thread_id: str, entry: PendingEntry) -> None:
+        """Store or replace the pending entry for a thread."""
+        key = self.KEY_PREFIX + thread_id
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(key, mapping=entry)
+            pipe.sadd(self.INDEX_KEY, thread_id)
+            if self.ttl:
+                pipe.expire(key, self.ttl)
+            pipe.publish(self.CHANGES_CHANNEL, orjson.dumps([thread_id, entry]))
+            await pipe.execute()
+
+    async def delete(self, thread_id: str) -> None:
+        """Remove the pending entry for a thread."""
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self.KEY_PREFIX + thread_id)
+            pipe.srem(self.INDEX_KEY, thread_id)
+            pipe.publish(self.CHANGES_CHANNEL, orjson.dumps([thread_id, None]))
+            await pipe.execute()
+
+    async def items(self) -> AsyncIterator[tuple[str, PendingEntry]]:
+        """Iterate over (thread_id, entry) pairs for all pending posts."""
+        thread_ids = list(await self._redis.smembers(self.INDEX_KEY))
+        if not thread_ids:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for thread_id in thread_ids:
+                pipe.hgetall(self.KEY_PREFIX + thread_id)
+            results = await pipe.execute()
+
+        # Entries expire on their own, so drop their IDs from the index here
+        expired = []
+        for thread_id, fields in zip(thread_ids, results):
+            if fields:
+                yield thread_id, self._decode(fields)
+            else:
+                expired.append(thread_id)
+
+        if expired:
+            await self._redis.srem(self.INDEX_KEY, *expired)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[asyncio.Queue[PendingChange]]:
+        """Open a queue that receives every change made by any worker."""
+        queue: asyncio.Queue[PendingChange] = asyncio.Queue()
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.CHANGES_CHANNEL)
+
+        async def forward() -> None:
+            async for message in pubsub.listen():
+                thread_id, entry = orjson.loads(message["data"])
+                queue.put_nowait((thread_id, entry))
+
+        task = asyncio.create_task(forward())
+        try:
+            yield queue
+        finally:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+            await pubsub.aclose()
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool."""
+        await self._redis.aclose()
+
+
+@lru_cache
+def get_pending_store() -> PendingStore:
+    """Get the shared pending store.
+
+    Uses Redis when REDIS_URL is set so every worker sees the same pending
+    posts, and falls back to process memory otherwise.
+    """
+    settings = get_settings()
+
+    if settings.redis_url:
+        return RedisPendingStore(settings.redis_url, ttl=settings.pending_ttl)
+    return MemoryPendingStore(ttl=settings.pending_ttl)
+
+
+async def close_pending_store() -> None:
+    """Close the shared pending store and clear the cached instance."""
+    await get_pending_store().aclose()
+    get_pending_store.cache_clear()
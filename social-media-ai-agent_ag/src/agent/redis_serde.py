@@ -0,0 +1,50 @@
+"""Checkpoint serializer for the Redis saver.
+
+Imported only when REDIS_URL is set, since it needs the redis extra.
+"""
+
+from enum import Enum
+from typing import Any
+
+from langgraph.checkpoint.redis.jsonplus_redis import JsonPlusRedisSerializer
+from pydantic import BaseModel
+
+from src.agent.serde import is_app_type, resolve_type, type_path
+
+# Markers wrapping app types in the JSON stored by the Redis saver
+PYDANTIC_MARKER = "__pydantic__"
+ENUM_MARKER = "__enum__"
+
+
+class RedisPydanticSerializer(JsonPlusRedisSerializer):
+    """Redis JSON serializer that restores the app's models and enums.
+
+    The stock Redis serializer turns Pydantic models into plain dicts and
+    str enums into plain strings, so a resumed workflow would read
+    PostContent, HumanFeedback and Platform back as the wrong types. App
+    models and enums are wrapped in a marker carrying their import path,
+    at any depth, and rebuilt on load.
+    """
+
+    def _preprocess_redis_json(self, obj: Any, **kwargs: Any) -> Any:
+        cls = type(obj)
+        if isinstance(obj, BaseModel) and is_app_type(cls):
+            return {
+                PYDANTIC_MARKER: type_path(cls),
+                "value": obj.model_dump(mode="json", exclude=set(cls.model_computed_fields)),
+            }
+        if isinstance(obj, Enum) and is_app_type(cls):
+            return {ENUM_MARKER: type_path(cls), "value": obj.value}
+        return super()._preprocess_redis_json(obj, **kwargs)
+
+    def _revive_if_needed(self, obj: Any) -> Any:
+        revived = super()._revive_if_needed(obj)
+        if not (isinstance(revived, dict) and len(revived) == 2 and "value" in revived):
+            return revived
+
+        if PYDANTIC_MARKER in revived:
+            model = resolve_type(revived[PYDANTIC_MARKER], BaseModel)
+            return model.model_validate(revived["value"])
+        if ENUM_MARKER in revived:
+            return resolve_type(revived[ENUM_MARKER], Enum)(revived["value"])
+        return revived
@@ -0,0 +1,72 @@
+"""Checkpoint serializer for the social media agent."""
+
+import importlib
+from typing import Any, TypeVar
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pydantic import BaseModel
+
+PYDANTIC_TYPE_PREFIX = "pydantic:"
+
+# Only types defined in these packages are rebuilt from checkpoint data
+ALLOWED_MODULE_PREFIXES = ("src.",)
+
+T = TypeVar("T")
+
+
+class PydanticJsonSerializer(JsonPlusSerializer):
+    """Serializer that writes Pydantic models with pydantic-core's JSON encoder.
+
+    State values such as PostContent and HumanFeedback are dumped with
+    model_dump_json and restored with model_validate_json, both of which run
+    in Rust. Computed fields are left out since they are derived on load.
+    Everything else falls through to the default LangGraph serializer.
+    """
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        """Serialize an object to a (type, bytes) pair."""
+        if isinstance(obj, BaseModel):
+            cls = type(obj)
+            return (
+                f"{PYDANTIC_TYPE_PREFIX}{type_path(cls)}",
+                obj.model_dump_json(exclude=set(cls.model_computed_fields)).encode(),
+            )
+        return super().dumps_typed(obj)
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        """Deserialize an object from a (type, bytes) pair.
+
+        Raises:
+            ValueError: If the type tag names a disallowed or non-Pydantic class.
+        """
+        type_, data_ = data
+        if type_.startswith(PYDANTIC_TYPE_PREFIX):
+            model = resolve_type(type_[len(PYDANTIC_TYPE_PREFIX):], BaseModel)
+            return model.model_validate_json(data_)
+        return super().loads_typed(data)
+
+
+def type_path(cls: type) -> str:
+    """Get the dotted import path of a class."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def is_app_type(cls: type) -> bool:
+    """Check whether a class may be rebuilt from checkpoint data."""
+    return cls.__module__.startswith(ALLOWED_MODULE_PREFIXES)
+
+
+def resolve_type(path: str, base: type[T]) -> type[T]:
+    """Import an allowed subclass of base from its dotted path.
+
+    Raises:
+        ValueError: If the module is not allowed or the class is not a subclass of base.
+    """
+    module_name, _, class_name = path.rpartition(".")
+    if not module_name.startswith(ALLOWED_MODULE_PREFIXES):
+        raise ValueError(f"Refusing to deserialize type from module: {module_name}")
+
+    cls = getattr(importlib.import_module(module_name), class_name, None)
+    if not (isinstance(cls, type) and issubclass(cls, base)):
+        raise ValueError(f"Not a {base.__name__} subclass: {path}")
+    return cls
@@ -1,12 +1,14 @@
 """LangGraph state definitions for the social media agent."""
 
-from datetime import datetime
+import operator
+from datetime import UTC, datetime
 from enum import Enum
-from typing import Annotated, Literal
+from functools import cached_property
+from typing import Annotated, Literal, TypedDict
 
 from langchain_core.messages import BaseMessage
 from langgraph.graph.message import add_messages
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 
 class PostStatus(str, Enum):
@@ -28,14 +30,21 @@ class Platform(str, Enum):
 
 
 class PostContent(BaseModel):
-    """Generated post content."""
+    """Generated post content.
+
+    Instances are immutable, so the formatted text and its length are
+    computed once on first access and reused afterwards.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     text: str = Field(..., description="The post text content")
     platform: Platform = Field(..., description="Target platform")
     hashtags: list[str] = Field(default_factory=list, description="Hashtags for the post")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def formatted_text(self) -> str:
         """Get the post text with hashtags appended."""
         if self.hashtags:
@@ -43,12 +52,22 @@ class PostContent(BaseModel):
             return f"{self.text}\n\n{hashtag_str}"
         return self.text
 
-    @property
+    @computed_field(repr=False)
+    @cached_property
     def char_count(self) -> int:
         """Get character count for the formatted text."""
         return len(self.formatted_text)
 
 
+class PostDraft(BaseModel):
+    """Structured LLM output for a generated post."""
+
+    text: str = Field(..., description="The post text, without hashtags")
+    hashtags: list[str] = Field(
+        default_factory=list, description="Relevant hashtags, without the # symbol"
+    )
+
+
 class HumanFeedback(BaseModel):
     """Human feedback on a generated post."""
 
@@ -63,60 +82,77 @@ class HumanFeedback(BaseModel):
     )
 
 
-class AgentState(BaseModel):
+class AgentState(TypedDict, total=False):
     """State for the LangGraph social media agent workflow.
 
     This state is passed between nodes and persisted for human-in-the-loop.
+    It is a plain dict so LangGraph skips model validation on every node
+    transition; use create_initial_state() to build a starting state.
     """
 
     # Conversation messages (LangGraph message handling)
-    messages: Annotated[list[BaseMessage], add_messages] = Field(default_factory=list)
+    messages: Annotated[list[BaseMessage], add_messages]
 
-    # User request
-    topic: str = Field(default="", description="Topic or theme for the post")
-    platform: Platform = Field(
-        default=Platform.TWITTER, description="Target social media platform"
-    )
-    tone: str = Field(
-        default="professional", description="Desired tone (professional, casual, humorous, etc.)"
-    )
-    additional_context: str = Field(
-        default="", description="Any additional context or requirements"
-    )
+    # User request: topic, target platform, desired tone and any extra requirements
+    topic: str
+    platform: Platform
+    tone: str
+    additional_context: str
 
-    # Generated content
-    post_content: PostContent | None = Field(
-        None, description="The generated post content"
-    )
+    # Generated content. Each generation appends itself to drafts through the
+    # reducer, so the history is never part of a (cached) node's output;
+    # rejects stop at max_attempts, which bounds its length.
+    post_content: PostContent | None
+    drafts: Annotated[list[PostContent], operator.add]
 
     # Workflow state
-    status: PostStatus = Field(
-        default=PostStatus.DRAFT, description="Current status in the workflow"
-    )
-    human_feedback: HumanFeedback | None = Field(
-        None, description="Feedback from human review"
-    )
-    generation_attempts: int = Field(
-        default=0, description="Number of generation attempts"
-    )
-    max_attempts: int = Field(
-        default=3, description="Maximum generation attempts before giving up"
-    )
+    status: PostStatus
+    human_feedback: HumanFeedback | None
+    generation_attempts: int
+    max_attempts: int
 
     # Result
-    published_url: str | None = Field(
-        None, description="URL of the published post"
-    )
-    error_message: str | None = Field(
-        None, description="Error message if publishing failed"
-    )
+    published_url: str | None
+    error_message: str | None
 
     # Thread tracking
-    thread_id: str = Field(
-        default="", description="Unique thread ID for persistence"
+    thread_id: str
+
+
+def create_initial_state(
+    topic: str,
+    platform: Platform = Platform.TWITTER,
+    tone: str = "professional",
+    additional_context: str = "",
+    thread_id: str = "",
+    max_attempts: int = 3,
+) -> AgentState:
+    """Create the starting state for a new post workflow.
+
+    Args:
+        topic: Topic or theme for the post.
+        platform: Target social media platform.
+        tone: Desired tone (professional, casual, humorous, etc.).
+        additional_context: Any additional context or requirements.
+        thread_id: Unique thread ID for persistence.
+        max_attempts: Maximum generation attempts before giving up.
+
+    Returns:
+        A fully populated AgentState.
+    """
+    return AgentState(
+        messages=[],
+        topic=topic,
+        platform=platform,
+        tone=tone,
+        additional_context=additional_context,
+        post_content=None,
+        drafts=[],
+        status=PostStatus.DRAFT,
+        human_feedback=None,
+        generation_attempts=0,
+        max_attempts=max_attempts,
+        published_url=None,
+        error_message=None,
+        thread_id=thread_id,
     )
-
-    class Config:
-        """Pydantic config."""
-
-        arbitrary_types_allowed = True
@@ -21,6 +21,12 @@ class Settings(BaseSettings):
     llm_provider: Literal["openai", "anthropic"] = "openai"
     llm_model: str = "gpt-4o"
 
+    # LLM response cache (off by default: identical requests would get identical posts)
+    llm_cache_enabled: bool = False
+    llm_cache_backend: Literal["memory", "redis", "file"] = "memory"
+    llm_cache_ttl: int | None = 3600
+    llm_cache_dir: str = "./data/llm_cache"
+
     # Twitter/X API
     twitter_api_key: str = ""
     twitter_api_secret: str = ""
@@ -36,10 +42,18 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite:///./data/agent.db"
 
+    # Redis (shared LLM cache and pending posts)
+    redis_url: str = ""
+
+    # Pending posts expire after this many seconds without a decision
+    pending_ttl: int | None = 3600
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = False
+    # API worker processes; more than one needs REDIS_URL for shared state
+    workers: int = 1
 
     @property
     def twitter_configured(self) -> bool:
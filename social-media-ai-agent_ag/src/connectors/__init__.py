@@ -1,13 +1,21 @@
 """Social media connectors package."""
 
+import asyncio
+from functools import lru_cache
+
 from src.agent.state import Platform
+from src.config import get_settings
 from src.connectors.base import BaseConnector
 from src.connectors.twitter import TwitterConnector
 from src.connectors.linkedin import LinkedInConnector
 
 
+@lru_cache
 def get_connector(platform: Platform) -> BaseConnector:
-    """Get the appropriate connector for a platform.
+    """Get the shared connector for a platform.
+
+    Connectors are cached per platform so pooled clients and the LinkedIn
+    user URN are reused for the lifetime of the process.
 
     Args:
         platform: The target social media platform.
@@ -30,9 +38,50 @@ def get_connector(platform: Platform) -> BaseConnector:
     return connector_class()
 
 
+async def close_connectors() -> None:
+    """Close all shared connectors and clear the connector cache."""
+    for platform in Platform:
+        await get_connector(platform).aclose()
+    get_connector.cache_clear()
+
+
+def _is_configured(platform: Platform) -> bool:
+    """Check whether credentials are set for a platform."""
+    settings = get_settings()
+    return {
+        Platform.TWITTER: settings.twitter_configured,
+        Platform.LINKEDIN: settings.linkedin_configured,
+    }.get(platform, False)
+
+
+async def validate_all() -> dict[Platform, bool | None]:
+    """Validate credentials for every configured platform concurrently.
+
+    Platforms without credentials are skipped rather than checked over the
+    network.
+
+    Returns:
+        A mapping of platform to whether its credentials are valid, or None
+        if the platform is not configured.
+    """
+    tasks = {
+        platform: get_connector(platform).validate_credentials()
+        for platform in Platform
+        if _is_configured(platform)
+    }
+    results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+    validated = {
+        platform: result if isinstance(result, bool) else False
+        for platform, result in zip(tasks, results)
+    }
+    return {platform: validated.get(platform) for platform in Platform}
+
+
 __all__ = [
     "BaseConnector",
     "TwitterConnector",
     "LinkedInConnector",
+    "close_connectors",
     "get_connector",
+    "validate_all",
 ]
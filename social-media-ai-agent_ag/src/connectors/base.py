@@ -53,6 +53,10 @@ class BaseConnector(ABC):
         """
         pass
 
+    async def aclose(self) -> None:
+        """Release any network resources held by the connector."""
+        pass
+
     def validate_content(self, content: str) -> tuple[bool, str]:
         """Validate content before publishing.
 
@@ -1,8 +1,10 @@
 """LinkedIn connector for posting to LinkedIn profiles."""
 
+import asyncio
 from typing import Any
 
 import httpx
+import orjson
 
 from src.config import get_settings
 from src.connectors.base import BaseConnector
@@ -21,6 +23,7 @@ class LinkedInConnector(BaseConnector):
         """Initialize the LinkedIn connector."""
         self.settings = get_settings()
         self._user_urn: str | None = None
+        self._http: httpx.AsyncClient | None = None
 
     @property
     def platform_name(self) -> str:
@@ -55,6 +58,35 @@ class LinkedInConnector(BaseConnector):
             "X-Restli-Protocol-Version": "2.0.0",
         }
 
+    async def _client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client for the LinkedIn API.
+
+        Returns:
+            An AsyncClient reused across calls so connections stay warm.
+        """
+        if self._http is None:
+            # Building the client loads the CA bundle from disk, so keep it
+            # off the event loop
+            client = await asyncio.to_thread(
+                httpx.AsyncClient,
+                base_url=self.API_BASE_URL,
+                headers=self.headers,
+                http2=True,
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+            if self._http is None:
+                self._http = client
+            else:
+                await client.aclose()
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     async def _get_user_urn(self) -> str:
         """Get the authenticated user's URN.
 
@@ -62,14 +94,11 @@ class LinkedInConnector(BaseConnector):
             The user URN in format 'urn:li:person:xxx'.
         """
         if self._user_urn is None:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.API_BASE_URL}/userinfo",
-                    headers=self.headers,
-                )
-                response.raise_for_status()
-                data = response.json()
-                self._user_urn = f"urn:li:person:{data['sub']}"
+            client = await self._client()
+            response = await client.get("/userinfo")
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            self._user_urn = f"urn:li:person:{data['sub']}"
 
         return self._user_urn
 
@@ -113,14 +142,11 @@ class LinkedInConnector(BaseConnector):
             },
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.API_BASE_URL}/ugcPosts",
-                headers=self.headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = await self._client()
+        # The client's default headers already set Content-Type: application/json
+        response = await client.post("/ugcPosts", content=orjson.dumps(payload))
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         post_id = data.get("id", "")
         # LinkedIn doesn't return a direct URL, construct it
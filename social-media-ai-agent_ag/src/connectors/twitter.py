@@ -88,12 +88,8 @@ class TwitterConnector(BaseConnector):
         if media_ids := kwargs.get("media_ids"):
             tweet_params["media_ids"] = media_ids
 
-        # Run in thread pool since Tweepy is synchronous
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.client.create_tweet(**tweet_params),
-        )
+        # Run in a worker thread since Tweepy is synchronous
+        response = await asyncio.to_thread(self.client.create_tweet, **tweet_params)
 
         tweet_id = response.data["id"]
         tweet_url = f"https://twitter.com/user/status/{tweet_id}"
@@ -112,11 +108,7 @@ class TwitterConnector(BaseConnector):
             True if credentials are valid.
         """
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self.client.get_me(),
-            )
+            response = await asyncio.to_thread(self.client.get_me)
             return response.data is not None
         except Exception:
             return False
@@ -2,30 +2,49 @@
 
 import argparse
 import asyncio
-import subprocess
+import os
 import sys
 from pathlib import Path
 
 
 def run_api():
-    """Run the FastAPI server."""
+    """Run the FastAPI server with the configured number of workers."""
     import uvicorn
 
     from src.config import get_settings
 
     settings = get_settings()
+    workers = settings.workers
+    if workers > 1 and not settings.redis_url:
+        print("⚠️ WORKERS > 1 without REDIS_URL: each worker keeps its own workflow state")
+
+    # "auto" picks uvloop and httptools, which uvicorn[standard] installs
+    # where they are supported. Auto-reload only works with a single worker.
     uvicorn.run(
         "src.web.api:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.debug,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        reload=settings.debug and workers == 1,
     )
 
 
-def run_ui():
-    """Run the Streamlit UI."""
+def _streamlit_command() -> list[str]:
+    """Build the command line that runs the Streamlit UI."""
     ui_path = Path(__file__).parent / "web" / "app.py"
-    subprocess.run([sys.executable, "-m", "streamlit", "run", str(ui_path)])
+    return [sys.executable, "-m", "streamlit", "run", str(ui_path)]
+
+
+def run_ui():
+    """Run the Streamlit UI, replacing the current process."""
+    command = _streamlit_command()
+
+    # Anything still buffered would be lost when the process image is replaced
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvp(command[0], command)
 
 
 def run_mcp():
@@ -35,19 +54,43 @@ def run_mcp():
     asyncio.run(main())
 
 
-def run_all():
-    """Run both API and UI (for development)."""
-    import threading
+async def _run_all():
+    """Serve the API and supervise the Streamlit UI on one event loop."""
+    import uvicorn
 
-    # Run API in a thread
-    api_thread = threading.Thread(target=run_api, daemon=True)
-    api_thread.start()
+    from src.config import get_settings
+
+    settings = get_settings()
+    server = uvicorn.Server(
+        uvicorn.Config("src.web.api:app", host=settings.host, port=settings.port)
+    )
+    print(f"🚀 API server starting on http://localhost:{settings.port}")
 
-    print("🚀 API server started on http://localhost:8000")
     print("🚀 Starting Streamlit UI...")
+    ui = await asyncio.create_subprocess_exec(*_streamlit_command())
+
+    async def serve_api():
+        try:
+            await server.serve()
+        finally:
+            # Stop the UI if the API exits first, e.g. when the port is taken
+            if ui.returncode is None:
+                ui.terminate()
+
+    async def watch_ui():
+        await ui.wait()
+        server.should_exit = True
 
-    # Run UI in main thread
-    run_ui()
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(serve_api())
+        tg.create_task(watch_ui())
+
+
+def run_all():
+    """Run both API and UI (for development)."""
+    # Ctrl-C reaches both: uvicorn shuts the API down gracefully, and
+    # Streamlit, in the same process group, exits on its own
+    asyncio.run(_run_all())
 
 
 def main():
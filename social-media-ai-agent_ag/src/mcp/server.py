@@ -1,9 +1,10 @@
 """MCP Server exposing social media agent tools."""
 
 import asyncio
-import json
 from typing import Any
 
+import orjson
+from langgraph.graph.state import CompiledStateGraph
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
@@ -12,108 +13,176 @@ from mcp.types import (
     Tool,
 )
 
-from src.agent.graph import get_compiled_graph
-from src.agent.state import AgentState, Platform
+from src.agent.graph import compile_graph, get_compiled_graph, open_checkpointer
+from src.agent.ids import new_thread_id
+from src.agent.nodes import warm_up
+from src.agent.pending import close_pending_store, get_pending_store
+from src.agent.state import Platform, create_initial_state
+from src.connectors import close_connectors
+from src.mcp.stdio import BufferedStdout
 
 # Create MCP server instance
 server = Server("social-media-agent")
 
-# Store for pending threads
-pending_threads: dict[str, dict[str, Any]] = {}
+# Concurrent tool calls per batch_execute request unless the client sets one
+DEFAULT_BATCH_CONCURRENCY = 4
 
+# Graph compiled against the configured checkpointer while main() runs
+_graph: CompiledStateGraph | None = None
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available tools for the MCP client."""
-    return [
-        Tool(
-            name="generate_social_post",
-            description="Generate a social media post for Twitter or LinkedIn using AI",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "The topic or theme for the post",
-                    },
-                    "platform": {
-                        "type": "string",
-                        "enum": ["twitter", "linkedin"],
-                        "description": "Target social media platform",
-                        "default": "twitter",
-                    },
-                    "tone": {
-                        "type": "string",
-                        "description": "Desired tone (professional, casual, humorous, etc.)",
-                        "default": "professional",
-                    },
-                    "additional_context": {
-                        "type": "string",
-                        "description": "Any additional requirements or context",
-                    },
+
+def _get_graph() -> CompiledStateGraph:
+    """Get the server's graph, or the shared in-memory graph outside main()."""
+    return _graph if _graph is not None else get_compiled_graph()
+
+
+def _dumps(obj: Any) -> str:
+    """Encode a tool response as indented JSON text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+
+class _BatchStoppedError(Exception):
+    """Raised inside a batch to cancel the remaining calls after an error."""
+
+
+# Tool definitions are constant, so build them once rather than per listing
+_TOOLS = [
+    Tool(
+        name="generate_social_post",
+        description="Generate a social media post for Twitter or LinkedIn using AI",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "topic": {
+                    "type": "string",
+                    "description": "The topic or theme for the post",
+                },
+                "platform": {
+                    "type": "string",
+                    "enum": ["twitter", "linkedin"],
+                    "description": "Target social media platform",
+                    "default": "twitter",
+                },
+                "tone": {
+                    "type": "string",
+                    "description": "Desired tone (professional, casual, humorous, etc.)",
+                    "default": "professional",
+                },
+                "additional_context": {
+                    "type": "string",
+                    "description": "Any additional requirements or context",
                 },
-                "required": ["topic"],
             },
-        ),
-        Tool(
-            name="list_pending_posts",
-            description="List all posts awaiting human approval",
-            inputSchema={
-                "type": "object",
-                "properties": {},
+            "required": ["topic"],
+        },
+    ),
+    Tool(
+        name="list_pending_posts",
+        description="List all posts awaiting human approval",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+        },
+    ),
+    Tool(
+        name="approve_post",
+        description="Approve a pending post for publishing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "thread_id": {
+                    "type": "string",
+                    "description": "The thread ID of the post to approve",
+                },
             },
-        ),
-        Tool(
-            name="approve_post",
-            description="Approve a pending post for publishing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {
-                        "type": "string",
-                        "description": "The thread ID of the post to approve",
-                    },
+            "required": ["thread_id"],
+        },
+    ),
+    Tool(
+        name="reject_post",
+        description="Reject a pending post and request regeneration",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "thread_id": {
+                    "type": "string",
+                    "description": "The thread ID of the post to reject",
+                },
+                "feedback": {
+                    "type": "string",
+                    "description": "Optional feedback for regeneration",
                 },
-                "required": ["thread_id"],
             },
-        ),
-        Tool(
-            name="reject_post",
-            description="Reject a pending post and request regeneration",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {
-                        "type": "string",
-                        "description": "The thread ID of the post to reject",
-                    },
-                    "feedback": {
-                        "type": "string",
-                        "description": "Optional feedback for regeneration",
-                    },
+            "required": ["thread_id"],
+        },
+    ),
+    Tool(
+        name="edit_and_approve_post",
+        description="Edit a pending post and approve it for publishing",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "thread_id": {
+                    "type": "string",
+                    "description": "The thread ID of the post to edit",
+                },
+                "edited_text": {
+                    "type": "string",
+                    "description": "The edited post text",
                 },
-                "required": ["thread_id"],
             },
+            "required": ["thread_id", "edited_text"],
+        },
+    ),
+    Tool(
+        name="batch_execute",
+        description=(
+            "Run several of the other tools concurrently and return their "
+            "results in the order given"
         ),
-        Tool(
-            name="edit_and_approve_post",
-            description="Edit a pending post and approve it for publishing",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "thread_id": {
-                        "type": "string",
-                        "description": "The thread ID of the post to edit",
-                    },
-                    "edited_text": {
-                        "type": "string",
-                        "description": "The edited post text",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Tool calls to run",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool",
+                            },
+                        },
+                        "required": ["name"],
                     },
                 },
-                "required": ["thread_id", "edited_text"],
+                "maxConcurrent": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum number of tool calls running at once",
+                    "default": DEFAULT_BATCH_CONCURRENCY,
+                },
+                "stopOnError": {
+                    "type": "boolean",
+                    "description": "Cancel the remaining calls after the first error",
+                    "default": False,
+                },
             },
-        ),
-    ]
+            "required": ["operations"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available tools for the MCP client."""
+    return _TOOLS
 
 
 @server.call_tool()
@@ -130,16 +199,17 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> CallToolResult:
         return await handle_approve(arguments, "reject")
     elif name == "edit_and_approve_post":
         return await handle_approve(arguments, "edit")
+    elif name == "batch_execute":
+        return await handle_batch_execute(arguments)
     else:
         return CallToolResult(
-            content=[TextContent(type="text", text=f"Unknown tool: {name}")]
+            content=[TextContent(type="text", text=f"Unknown tool: {name}")],
+            isError=True,
         )
 
 
 async def handle_generate_post(arguments: dict[str, Any]) -> CallToolResult:
     """Generate a new social media post."""
-    import uuid
-
     topic = arguments.get("topic", "")
     platform_str = arguments.get("platform", "twitter")
     tone = arguments.get("tone", "professional")
@@ -147,10 +217,10 @@ async def handle_generate_post(arguments: dict[str, Any]) -> CallToolResult:
 
     platform = Platform.TWITTER if platform_str == "twitter" else Platform.LINKEDIN
 
-    thread_id = str(uuid.uuid4())
-    graph = get_compiled_graph()
+    thread_id = new_thread_id()
+    graph = _get_graph()
 
-    initial_state = AgentState(
+    initial_state = create_initial_state(
         topic=topic,
         platform=platform,
         tone=tone,
@@ -161,30 +231,26 @@ async def handle_generate_post(arguments: dict[str, Any]) -> CallToolResult:
     config = {"configurable": {"thread_id": thread_id}}
 
     try:
-        result = await graph.ainvoke(initial_state.model_dump(), config)
-
-        pending_threads[thread_id] = {
-            "topic": topic,
-            "platform": platform_str,
-            "result": result,
-        }
+        result = await graph.ainvoke(initial_state, config)
 
         post_content = result.get("post_content")
         post_text = post_content.formatted_text if post_content else "Failed to generate"
 
+        # Store only the projected fields; the full state is checkpointed
+        await get_pending_store().record(thread_id, result)
+
         return CallToolResult(
             content=[
                 TextContent(
                     type="text",
-                    text=json.dumps(
+                    text=_dumps(
                         {
                             "thread_id": thread_id,
                             "status": "pending_approval",
                             "platform": platform_str,
                             "post_text": post_text,
                             "message": "Post generated! Please approve, reject, or edit.",
-                        },
-                        indent=2,
+                        }
                     ),
                 )
             ]
@@ -192,39 +258,33 @@ async def handle_generate_post(arguments: dict[str, Any]) -> CallToolResult:
 
     except Exception as e:
         return CallToolResult(
-            content=[TextContent(type="text", text=f"Error generating post: {str(e)}")]
+            content=[TextContent(type="text", text=f"Error generating post: {str(e)}")],
+            isError=True,
         )
 
 
 async def handle_list_pending() -> CallToolResult:
     """List all pending posts."""
-    if not pending_threads:
+    pending_list = [
+        {
+            "thread_id": thread_id,
+            "topic": entry["topic"],
+            "platform": entry["platform"],
+            "post_text": entry["post_text"],
+        }
+        async for thread_id, entry in get_pending_store().items()
+    ]
+
+    if not pending_list:
         return CallToolResult(
             content=[TextContent(type="text", text="No posts pending approval.")]
         )
 
-    pending_list = []
-    for thread_id, data in pending_threads.items():
-        result = data.get("result", {})
-        post_content = result.get("post_content")
-
-        if post_content:
-            pending_list.append(
-                {
-                    "thread_id": thread_id,
-                    "topic": data.get("topic"),
-                    "platform": data.get("platform"),
-                    "post_text": post_content.formatted_text
-                    if hasattr(post_content, "formatted_text")
-                    else str(post_content),
-                }
-            )
-
     return CallToolResult(
         content=[
             TextContent(
                 type="text",
-                text=json.dumps(pending_list, indent=2),
+                text=_dumps(pending_list),
             )
         ]
     )
@@ -236,14 +296,27 @@ async def handle_approve(arguments: dict[str, Any], action: str) -> CallToolResu
 
     thread_id = arguments.get("thread_id", "")
 
-    if thread_id not in pending_threads:
+    pending_store = get_pending_store()
+    pending = await pending_store.get(thread_id)
+    if pending is None:
         return CallToolResult(
-            content=[TextContent(type="text", text=f"Thread not found: {thread_id}")]
+            content=[TextContent(type="text", text=f"Thread not found: {thread_id}")],
+            isError=True,
         )
 
-    graph = get_compiled_graph()
+    graph = _get_graph()
     config = {"configurable": {"thread_id": thread_id}}
 
+    # A pending entry without a checkpoint cannot be resumed (e.g. it was
+    # written by a process with its own in-memory checkpointer), so drop it
+    state = await graph.aget_state(config)
+    if not state.values:
+        await pending_store.delete(thread_id)
+        return CallToolResult(
+            content=[TextContent(type="text", text=f"Thread not found: {thread_id}")],
+            isError=True,
+        )
+
     feedback = {"action": action}
     if action == "edit":
         feedback["edited_text"] = arguments.get("edited_text", "")
@@ -256,11 +329,8 @@ async def handle_approve(arguments: dict[str, Any], action: str) -> CallToolResu
         status = result.get("status", "unknown")
         published_url = result.get("published_url")
 
-        # Clean up if completed
-        if status in ["published", "failed"]:
-            pending_threads.pop(thread_id, None)
-        else:
-            pending_threads[thread_id]["result"] = result
+        # Clean up if completed, otherwise refresh the regenerated post
+        await pending_store.record(thread_id, result)
 
         response = {
             "thread_id": thread_id,
@@ -275,19 +345,87 @@ async def handle_approve(arguments: dict[str, Any], action: str) -> CallToolResu
             response["error"] = result.get("error_message")
 
         return CallToolResult(
-            content=[TextContent(type="text", text=json.dumps(response, indent=2))]
+            content=[TextContent(type="text", text=_dumps(response))]
         )
 
     except Exception as e:
         return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")]
+            content=[TextContent(type="text", text=f"Error: {str(e)}")],
+            isError=True,
         )
 
 
+async def handle_batch_execute(arguments: dict[str, Any]) -> CallToolResult:
+    """Run a list of tool calls concurrently, preserving their order in the result."""
+    operations = arguments.get("operations", [])
+    max_concurrent = max(1, arguments.get("maxConcurrent", DEFAULT_BATCH_CONCURRENCY))
+    stop_on_error = arguments.get("stopOnError", False)
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+    results: list[dict[str, Any] | None] = [None] * len(operations)
+
+    async def run(index: int, operation: dict[str, Any]) -> None:
+        name = operation.get("name", "")
+        async with semaphore:
+            if name == "batch_execute":
+                result = CallToolResult(
+                    content=[TextContent(type="text", text="batch_execute cannot be nested")],
+                    isError=True,
+                )
+            else:
+                result = await call_tool(name, operation.get("arguments") or {})
+
+        results[index] = {
+            "name": name,
+            "is_error": result.isError,
+            "result": "\n".join(
+                block.text for block in result.content if isinstance(block, TextContent)
+            ),
+        }
+        if result.isError and stop_on_error:
+            raise _BatchStoppedError
+
+    try:
+        async with asyncio.TaskGroup() as tg:
+            for index, operation in enumerate(operations):
+                tg.create_task(run(index, operation))
+    except* _BatchStoppedError:
+        pass
+
+    response = [
+        result
+        if result is not None
+        else {"name": operation.get("name", ""), "is_error": True, "result": "Cancelled"}
+        for operation, result in zip(operations, results)
+    ]
+
+    return CallToolResult(
+        content=[TextContent(type="text", text=_dumps(response))]
+    )
+
+
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    global _graph
+
+    # Build clients in a worker thread before serving tool calls
+    await asyncio.to_thread(warm_up)
+
+    stdout = BufferedStdout()
+    try:
+        # Use the same checkpointer as the API (Redis when configured), so
+        # pending posts listed from the shared store can be resumed here
+        async with open_checkpointer() as checkpointer:
+            _graph = compile_graph(checkpointer)
+            async with stdio_server(stdout=stdout) as (read_stream, write_stream):
+                await server.run(
+                    read_stream, write_stream, server.create_initialization_options()
+                )
+    finally:
+        _graph = None
+        await stdout.aclose()
+        await close_pending_store()
+        await close_connectors()
 
 
 if __name__ == "__main__":
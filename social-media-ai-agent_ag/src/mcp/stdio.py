@@ -0,0 +1,101 @@
+"""Buffered stdout for the MCP stdio transport."""
+
+import asyncio
+import sys
+from io import TextIOWrapper
+from typing import TextIO
+
+# Buffered output is written straight away once it grows past this size
+MAX_BUFFER_SIZE = 64 * 1024
+
+
+class BufferedStdout:
+    """Async text stdout that coalesces the transport's per-message flushes.
+
+    stdio_server writes and flushes once per JSON-RPC message. Here a write
+    only appends to an in-memory buffer, and a flush schedules a single
+    combined write that runs once the event loop has gone a full iteration
+    without new output, so a burst of messages (e.g. batch_execute results)
+    reaches the real stream in one write and flush.
+
+    Deferred writes run in the background, so the first error they hit
+    (e.g. BrokenPipeError once the client goes away) is kept and raised
+    from the next write or flush, failing the transport.
+    """
+
+    def __init__(self, stream: TextIO | None = None, max_buffer_size: int = MAX_BUFFER_SIZE):
+        """Initialize the buffered stdout.
+
+        Args:
+            stream: Stream to write to. Defaults to UTF-8 wrapped sys.stdout.
+            max_buffer_size: Buffered characters that force an immediate write.
+        """
+        self._stream = stream or TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+        self.max_buffer_size = max_buffer_size
+        self._buffer: list[str] = []
+        self._size = 0
+        self._pending: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+        self._error: OSError | ValueError | None = None
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    async def write(self, data: str) -> int:
+        """Append data to the buffer.
+
+        Raises:
+            OSError: If an earlier write to the stream failed.
+        """
+        self._raise_error()
+        self._buffer.append(data)
+        self._size += len(data)
+        return len(data)
+
+    async def flush(self) -> None:
+        """Schedule buffered data to be written, or write it now if the buffer is full.
+
+        Raises:
+            OSError: If a write to the stream failed.
+        """
+        self._raise_error()
+        if self._size >= self.max_buffer_size:
+            await self._drain()
+            self._raise_error()
+        elif self._pending is None:
+            self._pending = asyncio.create_task(self._deferred_drain())
+
+    async def aclose(self) -> None:
+        """Write out anything still buffered, ignoring write errors."""
+        if self._pending is not None:
+            await self._pending
+        await self._drain()
+
+    async def _deferred_drain(self) -> None:
+        # Keep yielding while other tasks are still producing output
+        size = -1
+        while size != self._size and self._size < self.max_buffer_size:
+            size = self._size
+            await asyncio.sleep(0)
+
+        self._pending = None
+        await self._drain()
+
+    async def _drain(self) -> None:
+        # Take the buffer under the lock so concurrent drains keep message order
+        async with self._lock:
+            if not self._buffer or self._error is not None:
+                return
+            data = "".join(self._buffer)
+            self._buffer.clear()
+            self._size = 0
+            try:
+                await asyncio.to_thread(self._write_through, data)
+            except (OSError, ValueError) as e:
+                # ValueError covers writing to a closed stream
+                self._error = e
+
+    def _write_through(self, data: str) -> None:
+        self._stream.write(data)
+        self._stream.flush()
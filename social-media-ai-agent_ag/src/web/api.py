@@ -1,32 +1,67 @@
 """FastAPI backend for the social media agent."""
 
-import uuid
+import asyncio
+from collections.abc import Awaitable, Callable
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Annotated, Any, Literal, TypeVar
 
-from fastapi import FastAPI, HTTPException
+import msgspec
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from langgraph.checkpoint.memory import MemorySaver
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from langgraph.graph.state import CompiledStateGraph
 from langgraph.types import Command
-from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 
-from src.agent.graph import compile_graph
-from src.agent.state import AgentState, Platform, PostStatus
+from src.agent.graph import compile_graph, open_checkpointer
+from src.agent.ids import new_thread_id
+from src.agent.nodes import warm_up
+from src.agent.pending import PendingEntry, close_pending_store, get_pending_store
+from src.agent.state import Platform, PostContent, PostStatus, create_initial_state
+from src.connectors import close_connectors, validate_all
 
 
-# In-memory storage for pending posts and checkpointer
-checkpointer = MemorySaver()
-compiled_graph = compile_graph(checkpointer)
-pending_threads: dict[str, dict[str, Any]] = {}
+# Seconds of pending-post changes collected into each server-sent event
+PENDING_STREAM_TICK = 0.5
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    # Startup
-    yield
-    # Shutdown
-    pending_threads.clear()
+    # The checkpointer (Redis when configured) stays open for the app's lifetime
+    async with open_checkpointer() as checkpointer:
+        app.state.graph = compile_graph(checkpointer)
+
+        # Build clients in a worker thread so their blocking setup never
+        # runs on the event loop during a request
+        await asyncio.to_thread(warm_up)
+
+        # Startup: check every platform's credentials in parallel
+        credentials = await validate_all()
+        for platform, valid in credentials.items():
+            if valid is None:
+                icon, label = "➖", "not configured"
+            else:
+                icon, label = ("✅", "valid") if valid else ("⚠️", "invalid")
+            print(f"{icon} {platform.value} credentials: {label}")
+        yield
+        # Shutdown
+        await close_pending_store()
+        await close_connectors()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response encoded with orjson."""
+
+    def render(self, content: object) -> bytes:
+        """Encode the response content."""
+        return orjson.dumps(content)
+
+
+def get_graph(request: Request) -> CompiledStateGraph:
+    """Get the compiled graph created in the lifespan handler."""
+    return request.app.state.graph
 
 
 app = FastAPI(
@@ -34,6 +69,7 @@ app = FastAPI(
     description="AI-powered social media post generation with human-in-the-loop approval",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS for Streamlit frontend
@@ -47,55 +83,135 @@ app.add_middleware(
 
 
 # Request/Response Models
-class GeneratePostRequest(BaseModel):
+class GeneratePostRequest(msgspec.Struct):
     """Request to generate a new social media post."""
 
-    topic: str = Field(..., description="Topic or theme for the post")
-    platform: Platform = Field(default=Platform.TWITTER, description="Target platform")
-    tone: str = Field(default="professional", description="Desired tone")
-    additional_context: str = Field(default="", description="Additional requirements")
+    topic: Annotated[str, msgspec.Meta(description="Topic or theme for the post")]
+    platform: Annotated[Platform, msgspec.Meta(description="Target platform")] = Platform.TWITTER
+    tone: Annotated[str, msgspec.Meta(description="Desired tone")] = "professional"
+    additional_context: Annotated[str, msgspec.Meta(description="Additional requirements")] = ""
 
 
-class ApprovalRequest(BaseModel):
+class ApprovalRequest(msgspec.Struct):
     """Request to approve, reject, or edit a post."""
 
-    action: str = Field(..., pattern="^(approve|reject|edit)$")
-    edited_text: str | None = Field(None, description="Edited text if action is 'edit'")
-    feedback_message: str | None = Field(None, description="Optional feedback")
+    action: Literal["approve", "reject", "edit"]
+    edited_text: Annotated[
+        str | None, msgspec.Meta(description="Edited text if action is 'edit'")
+    ] = None
+    feedback_message: Annotated[str | None, msgspec.Meta(description="Optional feedback")] = None
 
 
-class PostResponse(BaseModel):
-    """Response containing post information."""
+class PostResponse(msgspec.Struct):
+    """Response containing post information.
+
+    Endpoints return plain dicts of this shape, encoded by ORJSONResponse;
+    the struct documents the schema.
+    """
 
     thread_id: str
     status: str
-    post_text: str | None = None
     platform: str
+    post_text: str | None = None
     char_count: int | None = None
     published_url: str | None = None
     error_message: str | None = None
 
 
-class PendingPost(BaseModel):
-    """A post awaiting approval."""
+RequestT = TypeVar("RequestT", bound=msgspec.Struct)
+
+
+def _json_body(model: type[RequestT]) -> Callable[[Request], Awaitable[RequestT]]:
+    """Build a dependency that decodes and validates the request body with msgspec."""
+    decoder = msgspec.json.Decoder(model)
+
+    async def decode(request: Request) -> RequestT:
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise HTTPException(status_code=422, detail=str(e)) from e
+
+    return decode
+
+
+def _schema(model: type) -> dict[str, Any]:
+    """Build a self-contained JSON Schema for a msgspec type, for the OpenAPI docs."""
+    (schema,), components = msgspec.json.schema_components([model], ref_template="{name}")
+
+    def inline(node: Any) -> Any:
+        if isinstance(node, dict):
+            node = dict(node)
+            ref = node.pop("$ref", None)
+            target = inline(components[ref]) if ref else {}
+            return target | {key: inline(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [inline(value) for value in node]
+        return node
+
+    return inline(schema)
+
+
+def _body_docs(model: type) -> dict[str, Any]:
+    """Describe a msgspec request body in the route's OpenAPI operation."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": _schema(model)}},
+        }
+    }
+
+
+_POST_RESPONSE_DOCS = {200: {"content": {"application/json": {"schema": _schema(PostResponse)}}}}
+
+
+def _project_post(post_content: PostContent | dict | None) -> tuple[str | None, int | None]:
+    """Resolve post content once into its (formatted_text, char_count)."""
+    if post_content is None:
+        return None, None
+    if isinstance(post_content, dict):
+        return post_content.get("formatted_text"), post_content.get("char_count")
+    return post_content.formatted_text, post_content.char_count
 
-    thread_id: str
-    topic: str
-    platform: str
-    post_text: str
-    char_count: int
-    generation_attempt: int
+
+def _pending_post(thread_id: str, entry: PendingEntry) -> dict:
+    """Shape a pending store entry for API responses."""
+    return {
+        "thread_id": thread_id,
+        "topic": entry["topic"],
+        "platform": entry["platform"],
+        "post_text": entry["post_text"],
+        "char_count": entry["char_count"],
+        "generation_attempt": entry["attempts"],
+    }
+
+
+def _pointer(thread_id: str) -> str:
+    """Build the JSON Pointer for a thread in the pending posts object."""
+    return "/" + thread_id.replace("~", "~0").replace("/", "~1")
 
 
 # API Endpoints
+# The health response never changes, so its body is encoded once; a fresh
+# Response per request keeps middleware from editing shared headers
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "social-media-agent"})
+_HEALTH_HEADERS = {"Cache-Control": "public, max-age=5"}
+
+
 @app.get("/health")
-async def health_check():
+async def health_check() -> Response:
     """Health check endpoint for Railway."""
-    return {"status": "healthy", "service": "social-media-agent"}
+    return Response(_HEALTH_BODY, media_type="application/json", headers=_HEALTH_HEADERS)
 
 
-@app.post("/posts/generate", response_model=PostResponse)
-async def generate_post(request: GeneratePostRequest):
+@app.post(
+    "/posts/generate",
+    responses=_POST_RESPONSE_DOCS,
+    openapi_extra=_body_docs(GeneratePostRequest),
+)
+async def generate_post(
+    request: GeneratePostRequest = Depends(_json_body(GeneratePostRequest)),
+    graph: CompiledStateGraph = Depends(get_graph),
+):
     """Start a new post generation workflow.
 
     This will:
@@ -103,10 +219,10 @@ async def generate_post(request: GeneratePostRequest):
     2. Pause at the approval step
     3. Return the thread_id for tracking
     """
-    thread_id = str(uuid.uuid4())
+    thread_id = new_thread_id()
 
     # Create initial state
-    initial_state = AgentState(
+    initial_state = create_initial_state(
         topic=request.topic,
         platform=request.platform,
         tone=request.tone,
@@ -118,70 +234,120 @@ async def generate_post(request: GeneratePostRequest):
 
     try:
         # Run until we hit the interrupt (approval request)
-        result = await compiled_graph.ainvoke(initial_state.model_dump(), config)
+        result = await graph.ainvoke(initial_state, config)
+
+        # Store only the projected fields; the full state is checkpointed
+        await get_pending_store().record(thread_id, result)
+        post_text, char_count = _project_post(result.get("post_content"))
 
-        # Store in pending threads
-        pending_threads[thread_id] = {
-            "topic": request.topic,
+        return {
+            "thread_id": thread_id,
+            "status": result.get("status", PostStatus.PENDING_APPROVAL.value),
+            "post_text": post_text,
             "platform": request.platform.value,
-            "result": result,
+            "char_count": char_count,
+            "published_url": None,
+            "error_message": None,
         }
 
-        return PostResponse(
-            thread_id=thread_id,
-            status=result.get("status", PostStatus.PENDING_APPROVAL.value),
-            post_text=result.get("post_content", {}).get("formatted_text")
-            if result.get("post_content")
-            else None,
-            platform=request.platform.value,
-            char_count=result.get("post_content", {}).get("char_count")
-            if result.get("post_content")
-            else None,
-        )
-
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/posts/pending", response_model=list[PendingPost])
+@app.get(
+    "/posts/pending",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}},
+)
 async def list_pending_posts():
-    """List all posts awaiting approval."""
-    pending = []
-
-    for thread_id, data in pending_threads.items():
-        result = data.get("result", {})
-        post_content = result.get("post_content")
-
-        if post_content and result.get("status") == PostStatus.PENDING_APPROVAL.value:
-            pending.append(
-                PendingPost(
-                    thread_id=thread_id,
-                    topic=data.get("topic", ""),
-                    platform=data.get("platform", "twitter"),
-                    post_text=post_content.get("formatted_text", "")
-                    if isinstance(post_content, dict)
-                    else post_content.formatted_text,
-                    char_count=post_content.get("char_count", 0)
-                    if isinstance(post_content, dict)
-                    else post_content.char_count,
-                    generation_attempt=result.get("generation_attempts", 1),
-                )
-            )
-
-    return pending
-
-
-@app.post("/posts/{thread_id}/approve", response_model=PostResponse)
-async def approve_post(thread_id: str, request: ApprovalRequest):
+    """Stream all posts awaiting approval as newline-delimited JSON.
+
+    Each line is one object with thread_id, topic, platform, post_text,
+    char_count and generation_attempt, written as soon as it is read from
+    the pending store.
+    """
+
+    async def stream():
+        async for thread_id, entry in get_pending_store().items():
+            yield orjson.dumps(_pending_post(thread_id, entry)) + b"\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.get(
+    "/posts/pending/stream",
+    response_class=EventSourceResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_pending_posts():
+    """Push changes to the pending posts as server-sent events.
+
+    Each event's data is a JSON Patch (RFC 6902) array against an object
+    mapping thread_id to pending post. The first event replaces the whole
+    object; after that, changes are collected for PENDING_STREAM_TICK
+    seconds and sent as one consolidated patch.
+    """
+
+    async def events():
+        async with get_pending_store().subscribe() as changes:
+            # Subscribe before reading the snapshot so no change is missed
+            snapshot = {
+                thread_id: _pending_post(thread_id, entry)
+                async for thread_id, entry in get_pending_store().items()
+            }
+            yield orjson.dumps([{"op": "replace", "path": "", "value": snapshot}]).decode()
+
+            while True:
+                batch = dict([await changes.get()])
+                await asyncio.sleep(PENDING_STREAM_TICK)
+                while not changes.empty():
+                    thread_id, entry = changes.get_nowait()
+                    batch[thread_id] = entry
+
+                yield orjson.dumps(
+                    [
+                        {"op": "remove", "path": _pointer(thread_id)}
+                        if entry is None
+                        else {
+                            "op": "add",
+                            "path": _pointer(thread_id),
+                            "value": _pending_post(thread_id, entry),
+                        }
+                        for thread_id, entry in batch.items()
+                    ]
+                ).decode()
+
+    return EventSourceResponse(events(), ping=15)
+
+
+@app.post(
+    "/posts/{thread_id}/approve",
+    responses=_POST_RESPONSE_DOCS,
+    openapi_extra=_body_docs(ApprovalRequest),
+)
+async def approve_post(
+    thread_id: str,
+    request: ApprovalRequest = Depends(_json_body(ApprovalRequest)),
+    graph: CompiledStateGraph = Depends(get_graph),
+):
     """Approve, reject, or edit a pending post.
 
     This will resume the workflow with the human's decision.
     """
-    if thread_id not in pending_threads:
+    pending_store = get_pending_store()
+    pending = await pending_store.get(thread_id)
+    if pending is None:
         raise HTTPException(status_code=404, detail="Thread not found")
 
     config = {"configurable": {"thread_id": thread_id}}
 
+    # A pending entry without a checkpoint cannot be resumed (e.g. it was
+    # written by a process with its own in-memory checkpointer), so drop it
+    state = await graph.aget_state(config)
+    if not state.values:
+        await pending_store.delete(thread_id)
+        raise HTTPException(status_code=404, detail="Thread not found")
+
     # Create feedback payload
     feedback = {
         "action": request.action,
@@ -191,61 +357,55 @@ async def approve_post(thread_id: str, request: ApprovalRequest):
 
     try:
         # Resume the graph with human feedback using Command
-        result = await compiled_graph.ainvoke(
+        result = await graph.ainvoke(
             Command(resume=feedback),
             config,
         )
 
+        post_text, char_count = _project_post(result.get("post_content"))
+
         # Update or remove from pending
-        if result.get("status") in [
-            PostStatus.PUBLISHED.value,
-            PostStatus.FAILED.value,
-        ]:
-            pending_threads.pop(thread_id, None)
-        else:
-            pending_threads[thread_id]["result"] = result
-
-        post_content = result.get("post_content")
-
-        return PostResponse(
-            thread_id=thread_id,
-            status=result.get("status", "unknown"),
-            post_text=post_content.formatted_text
-            if post_content and hasattr(post_content, "formatted_text")
-            else None,
-            platform=pending_threads.get(thread_id, {}).get("platform", "twitter"),
-            published_url=result.get("published_url"),
-            error_message=result.get("error_message"),
-        )
+        await pending_store.record(thread_id, result)
+
+        return {
+            "thread_id": thread_id,
+            "status": result.get("status", "unknown"),
+            "post_text": post_text,
+            "platform": pending["platform"],
+            "char_count": char_count,
+            "published_url": result.get("published_url"),
+            "error_message": result.get("error_message"),
+        }
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/posts/{thread_id}", response_model=PostResponse)
-async def get_post_status(thread_id: str):
+@app.get("/posts/{thread_id}", responses=_POST_RESPONSE_DOCS)
+async def get_post_status(
+    thread_id: str, graph: CompiledStateGraph = Depends(get_graph)
+):
     """Get the current status of a post workflow."""
     config = {"configurable": {"thread_id": thread_id}}
 
     try:
-        state = await compiled_graph.aget_state(config)
+        state = await graph.aget_state(config)
 
-        if state.values is None:
+        if not state.values:
             raise HTTPException(status_code=404, detail="Thread not found")
 
         values = state.values
-        post_content = values.get("post_content")
-
-        return PostResponse(
-            thread_id=thread_id,
-            status=values.get("status", "unknown"),
-            post_text=post_content.formatted_text
-            if post_content and hasattr(post_content, "formatted_text")
-            else None,
-            platform=values.get("platform", Platform.TWITTER).value,
-            published_url=values.get("published_url"),
-            error_message=values.get("error_message"),
-        )
+        post_text, char_count = _project_post(values.get("post_content"))
+
+        return {
+            "thread_id": thread_id,
+            "status": values.get("status", "unknown"),
+            "post_text": post_text,
+            "platform": values.get("platform", Platform.TWITTER).value,
+            "char_count": char_count,
+            "published_url": values.get("published_url"),
+            "error_message": values.get("error_message"),
+        }
 
     except HTTPException:
         raise
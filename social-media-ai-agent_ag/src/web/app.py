@@ -1,11 +1,96 @@
 """Streamlit UI for human-in-the-loop approval workflow."""
 
-import requests
+import asyncio
+import threading
+import time
+
+import httpx
+import orjson
 import streamlit as st
+from httpx_sse import connect_sse
 
 # Configuration
 API_URL = "http://localhost:8000"
 
+# How often the pending list is redrawn from the locally mirrored posts
+PENDING_REFRESH_SECONDS = 1
+
+# How long a directly fetched pending list is reused across reruns
+PENDING_CACHE_SECONDS = 2
+
+# Badge and character limit per platform, keyed by the upper-cased platform name
+PLATFORM_META = {
+    "TWITTER": {"emoji": "🐦", "max_chars": 280},
+    "LINKEDIN": {"emoji": "💼", "max_chars": 3000},
+}
+
+
+@st.cache_resource
+def api_client() -> httpx.Client:
+    """Get the shared API client, reusing keep-alive connections across reruns."""
+    return httpx.Client(
+        base_url=API_URL,
+        timeout=60,
+        limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+    )
+
+
+class PendingMirror:
+    """Local copy of the pending posts, kept current by the API's SSE stream.
+
+    A daemon thread subscribes to /posts/pending/stream and applies each
+    JSON Patch it receives, so redrawing the pending list needs no request.
+    """
+
+    def __init__(self, base_url: str):
+        """Start mirroring the pending posts from the API."""
+        self.base_url = base_url
+        self.connected = False
+        self._posts: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def posts(self) -> list[dict] | None:
+        """Get the mirrored pending posts, or None while not connected."""
+        if not self.connected:
+            return None
+        with self._lock:
+            return list(self._posts.values())
+
+    def _run(self):
+        # The server pings every 15s, so a silent connection is a dead one
+        timeout = httpx.Timeout(10, read=30)
+        while True:
+            try:
+                with httpx.Client(base_url=self.base_url, timeout=timeout) as client:
+                    with connect_sse(client, "GET", "/posts/pending/stream") as events:
+                        for event in events.iter_sse():
+                            self._apply(orjson.loads(event.data))
+                            self.connected = True
+            except (httpx.HTTPError, ValueError):
+                pass
+            self.connected = False
+            time.sleep(2)
+
+    def _apply(self, patch: list[dict]):
+        with self._lock:
+            for op in patch:
+                if op["path"] == "":
+                    self._posts = dict(op["value"])
+                    continue
+
+                thread_id = op["path"][1:].replace("~1", "/").replace("~0", "~")
+                if op["op"] == "remove":
+                    self._posts.pop(thread_id, None)
+                else:
+                    self._posts[thread_id] = op["value"]
+
+
+@st.cache_resource
+def pending_mirror() -> PendingMirror:
+    """Get the shared pending posts mirror, started once per UI process."""
+    return PendingMirror(API_URL)
+
 
 def init_session_state():
     """Initialize session state variables."""
@@ -18,8 +103,8 @@ def init_session_state():
 def generate_post(topic: str, platform: str, tone: str, context: str):
     """Call the API to generate a new post."""
     try:
-        response = requests.post(
-            f"{API_URL}/posts/generate",
+        response = api_client().post(
+            "/posts/generate",
             json={
                 "topic": topic,
                 "platform": platform,
@@ -30,18 +115,24 @@ def generate_post(topic: str, platform: str, tone: str, context: str):
         )
         response.raise_for_status()
         return response.json()
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"Failed to generate post: {e}")
         return None
 
 
+@st.cache_data(ttl=PENDING_CACHE_SECONDS)
 def get_pending_posts():
-    """Fetch all pending posts from the API."""
+    """Fetch all pending posts from the API.
+
+    Results are cached briefly so reruns in quick succession share one
+    request; actions that change the pending posts clear the cache.
+    """
     try:
-        response = requests.get(f"{API_URL}/posts/pending", timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        # The API streams one JSON object per line
+        with api_client().stream("GET", "/posts/pending", timeout=10) as response:
+            response.raise_for_status()
+            return [orjson.loads(line) for line in response.iter_lines() if line]
+    except httpx.HTTPError as e:
         st.error(f"Failed to fetch pending posts: {e}")
         return []
 
@@ -53,18 +144,46 @@ def approve_post(thread_id: str, action: str, edited_text: str = None):
         if edited_text:
             payload["edited_text"] = edited_text
 
-        response = requests.post(
-            f"{API_URL}/posts/{thread_id}/approve",
+        response = api_client().post(
+            f"/posts/{thread_id}/approve",
             json=payload,
             timeout=30,
         )
         response.raise_for_status()
         return response.json()
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         st.error(f"Failed to process approval: {e}")
         return None
 
 
+def approve_all(thread_ids: list[str]) -> tuple[int, int]:
+    """Approve several pending posts concurrently.
+
+    Returns:
+        The number of posts approved and the number that failed.
+    """
+
+    async def approve(client: httpx.AsyncClient, thread_id: str) -> dict:
+        response = await client.post(
+            f"/posts/{thread_id}/approve",
+            json={"action": "approve"},
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def bulk() -> list[dict | BaseException]:
+        # Each approval waits on its own publish step, so overlap them
+        async with httpx.AsyncClient(base_url=API_URL, timeout=60) as client:
+            return await asyncio.gather(
+                *(approve(client, thread_id) for thread_id in thread_ids),
+                return_exceptions=True,
+            )
+
+    results = asyncio.run(bulk())
+    failed = sum(isinstance(result, BaseException) for result in results)
+    return len(results) - failed, failed
+
+
 def render_post_card(post: dict, index: int):
     """Render a single post card with approval actions."""
     with st.container():
@@ -72,12 +191,12 @@ def render_post_card(post: dict, index: int):
 
         # Platform badge
         platform = post.get("platform", "twitter").upper()
-        platform_color = "🐦" if platform == "TWITTER" else "💼"
-        st.markdown(f"{platform_color} **{platform}** | Topic: *{post.get('topic', 'N/A')}*")
+        meta = PLATFORM_META.get(platform, PLATFORM_META["TWITTER"])
+        max_chars = meta["max_chars"]
+        st.markdown(f"{meta['emoji']} **{platform}** | Topic: *{post.get('topic', 'N/A')}*")
 
         # Character count indicator
         char_count = post.get("char_count", 0)
-        max_chars = 280 if platform == "TWITTER" else 3000
         char_pct = (char_count / max_chars) * 100
 
         if char_pct > 90:
@@ -104,6 +223,7 @@ def render_post_card(post: dict, index: int):
                     if result.get("published_url"):
                         st.markdown(f"🔗 [View Post]({result.get('published_url')})")
                     st.session_state.last_action = "approved"
+                    get_pending_posts.clear()
                     st.rerun()
 
         with col2:
@@ -112,6 +232,7 @@ def render_post_card(post: dict, index: int):
                 if result:
                     st.warning("Post rejected. Regenerating...")
                     st.session_state.last_action = "rejected"
+                    get_pending_posts.clear()
                     st.rerun()
 
         with col3:
@@ -135,11 +256,42 @@ def render_post_card(post: dict, index: int):
                         st.markdown(f"🔗 [View Post]({result.get('published_url')})")
                     st.session_state[f"editing_{thread_id}"] = False
                     st.session_state.last_action = "edited"
+                    get_pending_posts.clear()
                     st.rerun()
 
         st.markdown("---")
 
 
+@st.fragment(run_every=PENDING_REFRESH_SECONDS)
+def render_pending_posts():
+    """Render the pending posts, redrawn as the mirror receives changes."""
+    # Use the SSE mirror when connected and fetch directly otherwise
+    pending_posts = pending_mirror().posts()
+    if pending_posts is None:
+        pending_posts = get_pending_posts()
+
+    if not pending_posts:
+        st.info(
+            "No posts pending approval. Use the sidebar to generate a new post!"
+        )
+    else:
+        st.markdown(f"**{len(pending_posts)} post(s) awaiting your approval**")
+
+        if len(pending_posts) > 1 and st.button("✅ Approve All", type="primary"):
+            with st.spinner("Approving posts..."):
+                approved, failed = approve_all([post["thread_id"] for post in pending_posts])
+            if failed:
+                st.error(f"Approved {approved} post(s); {failed} failed.")
+            else:
+                st.success(f"Approved {approved} post(s)!")
+            st.session_state.last_action = "approved"
+            get_pending_posts.clear()
+            st.rerun()
+
+        for i, post in enumerate(pending_posts):
+            render_post_card(post, i)
+
+
 def main():
     """Main Streamlit application."""
     st.set_page_config(
@@ -184,6 +336,7 @@ def main():
                     result = generate_post(topic, platform, tone, context)
                     if result:
                         st.success("Post generated! Check the main panel.")
+                        get_pending_posts.clear()
                         st.rerun()
 
         st.markdown("---")
@@ -193,22 +346,12 @@ def main():
     # Main content - Pending posts
     st.header("📋 Pending Approvals")
 
-    # Refresh button
+    # Refresh button; also drops the cached pending list
     if st.button("🔄 Refresh"):
+        get_pending_posts.clear()
         st.rerun()
 
-    # Fetch and display pending posts
-    pending_posts = get_pending_posts()
-
-    if not pending_posts:
-        st.info(
-            "No posts pending approval. Use the sidebar to generate a new post!"
-        )
-    else:
-        st.markdown(f"**{len(pending_posts)} post(s) awaiting your approval**")
-
-        for i, post in enumerate(pending_posts):
-            render_post_card(post, i)
+    render_pending_posts()
 
     # Footer
     st.markdown("---")
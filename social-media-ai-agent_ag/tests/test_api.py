@@ -0,0 +1,60 @@
+"""Tests for the FastAPI endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.agent.graph import compile_graph
+from src.web.api import app
+
+
+@pytest.fixture
+def client():
+    # Skip the lifespan, which checks platform credentials over the network
+    app.state.graph = compile_graph()
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("body", "detail"),
+    [
+        (b"{bad", "JSON is malformed"),
+        (b'{"platform": "twitter"}', "missing required field `topic`"),
+        (b'{"topic": "AI", "platform": "myspace"}', "`$.platform`"),
+    ],
+)
+def test_generate_rejects_invalid_body(client, body, detail):
+    response = client.post(
+        "/posts/generate", content=body, headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 422
+    assert detail in response.json()["detail"]
+
+
+def test_approve_rejects_unknown_action(client):
+    response = client.post("/posts/thread-1/approve", json={"action": "publish"})
+
+    assert response.status_code == 422
+    assert "`$.action`" in response.json()["detail"]
+
+
+def test_approve_decodes_valid_body(client):
+    response = client.post("/posts/thread-1/approve", json={"action": "approve"})
+
+    assert response.status_code == 404
+
+
+def test_request_bodies_are_documented(client):
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/posts/generate"]["post"]["requestBody"]
+    properties = body["content"]["application/json"]["schema"]["properties"]
+
+    assert body["required"]
+    assert properties["platform"]["enum"] == ["linkedin", "twitter"]
+    assert properties["platform"]["description"] == "Target platform"
+
+
+def test_unknown_post_is_not_found(client):
+    response = client.get("/posts/nonexistent")
+
+    assert response.status_code == 404
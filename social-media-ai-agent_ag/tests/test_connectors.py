@@ -0,0 +1,40 @@
+"""Tests for the connectors package."""
+
+from types import SimpleNamespace
+
+from src.agent.state import Platform
+from src.connectors import validate_all
+
+
+class FakeConnector:
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    async def validate_credentials(self) -> bool:
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+async def test_validate_all_skips_unconfigured_platforms(monkeypatch):
+    connectors = {Platform.TWITTER: FakeConnector(True), Platform.LINKEDIN: FakeConnector(True)}
+    settings = SimpleNamespace(twitter_configured=True, linkedin_configured=False)
+    monkeypatch.setattr("src.connectors.get_connector", connectors.__getitem__)
+    monkeypatch.setattr("src.connectors.get_settings", lambda: settings)
+
+    assert await validate_all() == {Platform.TWITTER: True, Platform.LINKEDIN: None}
+    assert connectors[Platform.LINKEDIN].calls == 0
+
+
+async def test_validate_all_reports_errors_as_invalid(monkeypatch):
+    connectors = {
+        Platform.TWITTER: FakeConnector(RuntimeError("boom")),
+        Platform.LINKEDIN: FakeConnector(False),
+    }
+    settings = SimpleNamespace(twitter_configured=True, linkedin_configured=True)
+    monkeypatch.setattr("src.connectors.get_connector", connectors.__getitem__)
+    monkeypatch.setattr("src.connectors.get_settings", lambda: settings)
+
+    assert await validate_all() == {Platform.TWITTER: False, Platform.LINKEDIN: False}
@@ -0,0 +1,17 @@
+"""Tests for thread ID generation."""
+
+import uuid
+
+from src.agent.ids import ENTROPY_POOL_SIZE, new_thread_id
+
+
+def test_thread_ids_are_random_uuids():
+    # Draw past one pool refill
+    ids = [new_thread_id() for _ in range(ENTROPY_POOL_SIZE // 16 * 2 + 1)]
+
+    assert len(set(ids)) == len(ids)
+    for thread_id in ids:
+        parsed = uuid.UUID(thread_id)
+        assert str(parsed) == thread_id
+        assert parsed.version == 4
+        assert parsed.variant == uuid.RFC_4122
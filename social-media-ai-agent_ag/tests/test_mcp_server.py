@@ -0,0 +1,74 @@
+"""Tests for the MCP server's batch_execute tool."""
+
+import asyncio
+
+import orjson
+import pytest
+from mcp.types import CallToolResult, TextContent
+
+from src.mcp.server import handle_batch_execute
+
+
+@pytest.fixture
+def running(monkeypatch):
+    """Replace generate_social_post with a tool that sleeps, tracking concurrency."""
+    stats = {"running": 0, "peak": 0}
+
+    async def fake_generate(arguments):
+        stats["running"] += 1
+        stats["peak"] = max(stats["peak"], stats["running"])
+        try:
+            await asyncio.sleep(arguments.get("delay", 0))
+        finally:
+            stats["running"] -= 1
+        return CallToolResult(content=[TextContent(type="text", text=arguments["topic"])])
+
+    monkeypatch.setattr("src.mcp.server.handle_generate_post", fake_generate)
+    return stats
+
+
+def _op(topic: str, delay: float = 0) -> dict:
+    return {"name": "generate_social_post", "arguments": {"topic": topic, "delay": delay}}
+
+
+async def _batch(**arguments) -> list[dict]:
+    result = await handle_batch_execute(arguments)
+    return orjson.loads(result.content[0].text)
+
+
+async def test_results_keep_operation_order(running):
+    results = await _batch(operations=[_op("a", 0.03), _op("b"), _op("c", 0.01)])
+
+    assert [r["result"] for r in results] == ["a", "b", "c"]
+    assert not any(r["is_error"] for r in results)
+
+
+async def test_max_concurrent_limits_running_calls(running):
+    await _batch(operations=[_op(str(i), 0.01) for i in range(6)], maxConcurrent=2)
+
+    assert running["peak"] == 2
+
+
+async def test_errors_do_not_stop_the_batch_by_default(running):
+    results = await _batch(operations=[{"name": "missing"}, _op("b", 0.01)])
+
+    assert results[0] == {"name": "missing", "is_error": True, "result": "Unknown tool: missing"}
+    assert results[1]["result"] == "b"
+
+
+async def test_stop_on_error_cancels_remaining_calls(running):
+    results = await _batch(
+        operations=[_op("a", 0.05), {"name": "missing"}, _op("c", 0.05)],
+        stopOnError=True,
+    )
+
+    assert [r["is_error"] for r in results] == [True, True, True]
+    assert [r["result"] for r in results] == ["Cancelled", "Unknown tool: missing", "Cancelled"]
+    assert running["running"] == 0
+
+
+async def test_nested_batch_is_rejected(running):
+    results = await _batch(operations=[{"name": "batch_execute", "arguments": {}}])
+
+    assert results[0]["is_error"]
+    assert results[0]["result"] == "batch_execute cannot be nested"
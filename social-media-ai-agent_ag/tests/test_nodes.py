@@ -0,0 +1,146 @@
+"""Tests for the agent's graph nodes."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.agent.nodes import _draft_post, _parse_human_response, generate_post
+from src.agent.state import Platform, PostContent, PostDraft, create_initial_state
+
+
+class FakeLLMCache:
+    """Stands in for the LLM cache, returning canned responses."""
+
+    def __init__(self, draft: PostDraft, hashtag_text: str = ""):
+        self.draft = draft
+        self.hashtag_text = hashtag_text
+        self.hashtag_calls = 0
+
+    async def ainvoke_structured(self, chain, schema, inputs, **key_inputs):
+        return self.draft
+
+    async def ainvoke(self, chain, inputs, **key_inputs):
+        self.hashtag_calls += 1
+        return self.hashtag_text
+
+
+@pytest.fixture
+def draft_post(monkeypatch):
+    """Run _draft_post for a Twitter post against a fake LLM cache."""
+    chains = {platform: None for platform in Platform}
+    monkeypatch.setattr("src.agent.nodes.get_llm", lambda: None)
+    monkeypatch.setattr("src.agent.nodes._get_chains", lambda: (chains, chains))
+
+    async def run(cache: FakeLLMCache):
+        monkeypatch.setattr("src.agent.nodes.get_llm_cache", lambda: cache)
+        state = create_initial_state(topic="AI", platform=Platform.TWITTER)
+        return await _draft_post(state, Platform.TWITTER, "", 0)
+
+    return run
+
+
+@pytest.mark.parametrize("response", ["approve", "  APPROVE  ", "Approve"])
+def test_parse_approve(response):
+    feedback = _parse_human_response(response)
+
+    assert feedback.action == "approve"
+    assert feedback.feedback_message is None
+
+
+def test_parse_reject_with_feedback():
+    feedback = _parse_human_response("Reject: Too Formal")
+
+    assert feedback.action == "reject"
+    assert feedback.feedback_message == "Too Formal"
+
+
+def test_parse_reject_without_feedback():
+    assert _parse_human_response("reject").feedback_message is None
+
+
+def test_parse_edit_keeps_text_casing():
+    feedback = _parse_human_response("EDIT:  Launching GPT-5 Today: Big News ")
+
+    assert feedback.action == "edit"
+    assert feedback.edited_text == "Launching GPT-5 Today: Big News"
+
+
+@pytest.mark.parametrize("response", ["edit", "looks good", "approved!"])
+def test_parse_unclear_defaults_to_approve(response):
+    feedback = _parse_human_response(response)
+
+    assert feedback.action == "approve"
+    assert feedback.feedback_message == f"Unclear response: {response}"
+
+
+def test_parse_dict():
+    feedback = _parse_human_response({"action": "edit", "edited_text": "New"})
+
+    assert feedback.action == "edit"
+    assert feedback.edited_text == "New"
+
+
+async def test_draft_falls_back_to_hashtag_call(draft_post):
+    cache = FakeLLMCache(
+        PostDraft(text="A post"), hashtag_text="1. #AI\n2. Health\n3. #Tech\n4. #More"
+    )
+
+    post = await draft_post(cache)
+
+    assert cache.hashtag_calls == 1
+    assert post.text == "A post"
+    assert post.hashtags == ["AI", "Health", "Tech"]
+
+
+async def test_draft_strips_and_reuses_trailing_hashtags(draft_post):
+    cache = FakeLLMCache(PostDraft(text="A post about AI #AI #Tech"))
+
+    post = await draft_post(cache)
+
+    assert cache.hashtag_calls == 0
+    assert post.text == "A post about AI"
+    assert post.hashtags == ["AI", "Tech"]
+
+
+async def test_draft_keeps_a_body_of_only_hashtags(draft_post):
+    cache = FakeLLMCache(PostDraft(text="#AI #Tech"), hashtag_text="#News")
+
+    post = await draft_post(cache)
+
+    assert post.text == "#AI #Tech"
+    assert post.hashtags == ["News"]
+
+
+async def test_draft_normalizes_structured_hashtags(draft_post):
+    cache = FakeLLMCache(
+        PostDraft(
+            text="A post #Ignored",
+            hashtags=["#AI", "Machine Learning", "2024", "#Tech", "Extra"],
+        )
+    )
+
+    post = await draft_post(cache)
+
+    assert cache.hashtag_calls == 0
+    assert post.text == "A post"
+    assert post.hashtags == ["AI", "MachineLearning", "Tech"]
+
+
+async def test_generate_output_does_not_depend_on_draft_history(monkeypatch):
+    # The node cache may replay this output into another thread, so it must
+    # only carry the new draft; the state reducer appends it to the history
+    post = PostContent(text="New", platform=Platform.TWITTER)
+
+    async def fake_draft(state, platform, additional_context, length_retry):
+        return post
+
+    monkeypatch.setattr("src.agent.nodes._draft_post", fake_draft)
+    monkeypatch.setattr(
+        "src.connectors.get_connector", lambda platform: SimpleNamespace(max_length=280)
+    )
+    state = create_initial_state(topic="AI", platform=Platform.TWITTER)
+    state["drafts"] = [PostContent(text="Old", platform=Platform.TWITTER)]
+
+    update = await generate_post(state)
+
+    assert update["drafts"] == [post]
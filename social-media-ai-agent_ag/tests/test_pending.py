@@ -0,0 +1,64 @@
+"""Tests for the in-memory pending post store."""
+
+import asyncio
+
+from src.agent.pending import MemoryPendingStore, PendingEntry
+
+ENTRY: PendingEntry = {
+    "topic": "AI in healthcare",
+    "platform": "twitter",
+    "post_text": "Hello #AI",
+    "char_count": 9,
+    "attempts": 1,
+}
+
+
+async def test_set_get_delete():
+    store = MemoryPendingStore()
+
+    await store.set("a", ENTRY)
+    assert await store.get("a") == ENTRY
+    assert [item async for item in store.items()] == [("a", ENTRY)]
+
+    await store.delete("a")
+    assert await store.get("a") is None
+    assert [item async for item in store.items()] == []
+
+
+async def test_delete_missing_is_noop():
+    store = MemoryPendingStore()
+
+    await store.delete("missing")
+
+    assert await store.get("missing") is None
+
+
+async def test_entries_expire_after_ttl(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("src.agent.pending.time.monotonic", lambda: now)
+    store = MemoryPendingStore(ttl=60)
+    await store.set("a", ENTRY)
+
+    now += 59
+    assert await store.get("a") == ENTRY
+
+    now += 2
+    assert await store.get("a") is None
+    assert [item async for item in store.items()] == []
+
+
+async def test_subscribers_receive_changes():
+    store = MemoryPendingStore()
+
+    async with store.subscribe() as queue:
+        await store.set("a", ENTRY)
+        await store.delete("a")
+        await store.delete("a")
+
+        assert await asyncio.wait_for(queue.get(), 1) == ("a", ENTRY)
+        assert await asyncio.wait_for(queue.get(), 1) == ("a", None)
+        assert queue.empty()
+
+    # Closed subscriptions stop receiving changes
+    await store.set("b", ENTRY)
+    assert queue.empty()
@@ -0,0 +1,78 @@
+"""Tests for the Redis checkpoint serializer."""
+
+import pytest
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Command
+
+from src.agent.graph import compile_graph
+from src.agent.pending import project_pending
+from src.agent.state import (
+    HumanFeedback,
+    Platform,
+    PostContent,
+    PostStatus,
+    create_initial_state,
+)
+
+pytest.importorskip("langgraph.checkpoint.redis")
+
+from src.agent.redis_serde import RedisPydanticSerializer  # noqa: E402
+
+
+@pytest.fixture
+def serde() -> RedisPydanticSerializer:
+    return RedisPydanticSerializer()
+
+
+def test_nested_app_types_round_trip(serde):
+    post = PostContent(text="Hello", platform=Platform.LINKEDIN, hashtags=["#AI"])
+    values = {
+        "post_content": post,
+        "drafts": [post],
+        "platform": Platform.LINKEDIN,
+        "status": PostStatus.PENDING_APPROVAL,
+        "human_feedback": HumanFeedback(action="reject"),
+        "messages": [AIMessage(content="Generated linkedin post")],
+    }
+
+    loaded = serde.loads_typed(serde.dumps_typed(values))
+
+    assert loaded == values
+    assert loaded["platform"] is Platform.LINKEDIN
+    assert loaded["status"] is PostStatus.PENDING_APPROVAL
+    assert isinstance(loaded["drafts"][0], PostContent)
+    assert isinstance(loaded["messages"][0], AIMessage)
+
+
+def test_rejects_models_outside_src(serde):
+    with pytest.raises(ValueError, match="Refusing"):
+        serde.loads_typed(("json", b'{"__pydantic__": "os.system", "value": {}}'))
+
+
+async def test_generate_then_resume(monkeypatch):
+    async def fake_draft(state, platform, additional_context, length_retry):
+        return PostContent(
+            text=f"Draft {state['generation_attempts']}",
+            platform=state["platform"],
+            hashtags=["AI"],
+        )
+
+    monkeypatch.setattr("src.agent.nodes._draft_post", fake_draft)
+    graph = compile_graph(MemorySaver(serde=RedisPydanticSerializer()))
+    config = {"configurable": {"thread_id": "thread-1"}}
+
+    await graph.ainvoke(
+        create_initial_state(topic="AI", platform=Platform.TWITTER, thread_id="thread-1"),
+        config,
+    )
+    result = await graph.ainvoke(Command(resume={"action": "reject"}), config)
+
+    assert result["status"] is PostStatus.PENDING_APPROVAL
+    assert result["post_content"].formatted_text == "Draft 1\n\n#AI"
+    assert [draft.text for draft in result["drafts"]] == ["Draft 0", "Draft 1"]
+
+    state = (await graph.aget_state(config)).values
+    assert state["platform"] is Platform.TWITTER
+    assert state["status"] is PostStatus.PENDING_APPROVAL
+    assert project_pending(state)["post_text"] == "Draft 1\n\n#AI"
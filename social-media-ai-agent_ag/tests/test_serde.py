@@ -0,0 +1,57 @@
+"""Tests for the checkpoint serializer."""
+
+import pytest
+
+from src.agent.serde import PydanticJsonSerializer
+from src.agent.state import HumanFeedback, Platform, PostContent
+
+
+@pytest.fixture
+def serde() -> PydanticJsonSerializer:
+    return PydanticJsonSerializer()
+
+
+def test_post_content_round_trip(serde):
+    post = PostContent(text="Hello", platform=Platform.LINKEDIN, hashtags=["#AI"])
+
+    type_, data = serde.dumps_typed(post)
+    loaded = serde.loads_typed((type_, data))
+
+    assert type_ == "pydantic:src.agent.state.PostContent"
+    assert b"formatted_text" not in data
+    assert loaded == post
+    assert loaded.platform is Platform.LINKEDIN
+    assert loaded.formatted_text == post.formatted_text
+
+
+def test_human_feedback_round_trip(serde):
+    feedback = HumanFeedback(action="reject", feedback_message="Too long")
+
+    loaded = serde.loads_typed(serde.dumps_typed(feedback))
+
+    assert isinstance(loaded, HumanFeedback)
+    assert loaded == feedback
+
+
+def test_other_values_use_default_serializer(serde):
+    value = {"topic": "AI", "attempts": [1, 2]}
+
+    assert serde.loads_typed(serde.dumps_typed(value)) == value
+
+
+@pytest.mark.parametrize(
+    "type_",
+    [
+        "pydantic:pydantic.main.BaseModel",
+        "pydantic:os.system",
+        "pydantic:srcevil.Model",
+    ],
+)
+def test_rejects_models_outside_src(serde, type_):
+    with pytest.raises(ValueError, match="Refusing"):
+        serde.loads_typed((type_, b"{}"))
+
+
+def test_rejects_non_model_in_src(serde):
+    with pytest.raises(ValueError, match="Not a BaseModel subclass"):
+        serde.loads_typed(("pydantic:src.agent.state.create_initial_state", b"{}"))
@@ -0,0 +1,73 @@
+"""Tests for the buffered MCP stdout."""
+
+import asyncio
+import io
+
+import pytest
+
+from src.mcp.stdio import BufferedStdout
+
+
+class RecordingStream(io.StringIO):
+    """Text stream that counts the writes it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data: str) -> int:
+        self.writes += 1
+        return super().write(data)
+
+
+class BrokenStream:
+    """Text stream whose reader has gone away."""
+
+    def write(self, data: str) -> int:
+        raise BrokenPipeError(32, "Broken pipe")
+
+    def flush(self) -> None:
+        pass
+
+
+async def _send(stdout: BufferedStdout, message: str) -> None:
+    await stdout.write(message)
+    await stdout.flush()
+
+
+async def test_concurrent_messages_are_coalesced():
+    stream = RecordingStream()
+    stdout = BufferedStdout(stream)
+
+    await asyncio.gather(*(_send(stdout, f"{i}\n") for i in range(10)))
+    await stdout.aclose()
+
+    assert stream.getvalue() == "".join(f"{i}\n" for i in range(10))
+    assert stream.writes == 1
+
+
+async def test_full_buffer_is_written_immediately():
+    stream = RecordingStream()
+    stdout = BufferedStdout(stream, max_buffer_size=4)
+
+    await _send(stdout, "12345")
+
+    assert stream.getvalue() == "12345"
+
+
+async def test_write_error_is_raised_from_next_call():
+    stdout = BufferedStdout(BrokenStream())
+    await _send(stdout, "lost\n")
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(BrokenPipeError):
+        await stdout.write("next\n")
+    with pytest.raises(BrokenPipeError):
+        await stdout.flush()
+
+
+async def test_aclose_ignores_write_errors():
+    stdout = BufferedStdout(BrokenStream())
+    await stdout.write("lost\n")
+
+    await stdout.aclose()